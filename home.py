@@ -5,8 +5,8 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objs as go
 import time
-from modules.sim.simconfig import load_player_data
-from modules.sim.simulator import run_match_simulation, PlayerStats
+from modules.sim.simconfig import load_player_data_cached, get_player_stats_array
+from modules.sim.simulator import simulate_many
 import streamlit.components.v1 as components
 
 
@@ -14,38 +14,31 @@ st.set_page_config(page_title="Tennis Sim", layout="wide")
 st.title("Tennis Match Sim")
 st.subheader("<<< configure simulation in sidebar")
 st.sidebar.header("v0.2.1-alpha")
-@st.cache_data
 def get_player_data():
     filepath = 'data/tennis/player_stats_with_id.csv'  # Adjust the path as needed
-    data = load_player_data(filepath)
+    data, stats_index, opponent_groups, stats_table = load_player_data_cached(filepath)
     if data.empty:
         st.error("Player data could not be loaded. Please check the CSV file.")
-    return data
-player_data = get_player_data()
-if 'Category' not in player_data.columns:
-
-    player_data['Category'] = player_data['League'].apply(
-        lambda x: 'ATP' if 'ATP' in x.upper() else 'WTA' if 'WTA' in x.upper() else 'Unknown'
-    )
+    return data, stats_index, opponent_groups, stats_table
+player_data, stats_index, opponent_groups, stats_table = get_player_data()
 available_surfaces = player_data['Surface'].unique().tolist()
 available_surfaces = [surf for surf in available_surfaces if surf.lower() != 'unknown']
 selected_surface = st.sidebar.selectbox("Select Surface Type", options=available_surfaces, index=0)
 selected_player = st.sidebar.selectbox("Select Player", options=player_data['Player'].unique())
 player_filtered_data = player_data[
     (player_data['Player'] == selected_player) &
-    (player_data['Surface'] == selected_surface)
+    (player_data['Surface'] == selected_surface) &
+    player_data['ValidStats']
 ]
 if player_filtered_data.empty:
     st.error(f"{selected_player} does not have statistics for the {selected_surface} surface.")
     st.stop()
 selected_player_row = player_filtered_data.iloc[0]
 selected_category = selected_player_row['Category']
-valid_opponents = player_data[
-    (player_data['Category'] == selected_category) &
-    (player_data['Surface'] == selected_surface)
-]['Player'].tolist()
-if selected_player in valid_opponents:
-    valid_opponents.remove(selected_player)  # Remove self from opponents
+valid_opponents = [
+    player for player in opponent_groups.get((selected_category, selected_surface), ())
+    if player != selected_player  # Remove self from opponents
+]
 if not valid_opponents:
     st.warning(f"No valid opponents available for {selected_player} on the {selected_surface} surface.")
     st.stop()
@@ -60,114 +53,133 @@ num_simulations = st.sidebar.select_slider(
 
 
 
+best_of = 3
+redraw_interval = 0.25  # Minimum seconds between intermediate histogram renders
+max_progress_updates = 20
+
+
+def build_histogram_figure():
+    """Create the fantasy point distribution figure once; bars are filled in by update_histogram."""
+    bars1 = go.Bar(
+        name=selected_player,
+        opacity=0.6,
+        marker_color='blue'
+    )
+    bars2 = go.Bar(
+        name=selected_opponent,
+        opacity=0.6,
+        marker_color='orange'
+    )
+    layout = go.Layout(
+        title='Fantasy Points Distribution',
+        xaxis_title='Fantasy Points',
+        yaxis_title='Frequency',
+        barmode='overlay',
+        bargap=0,
+        width=1600,   # Smaller width
+        height=600   # Smaller height
+    )
+    return go.Figure(data=[bars1, bars2], layout=layout)
+
+
+def update_histogram(fig, player1_points, player2_points, nbins=30):
+    """Bin the samples with NumPy and send only the bar heights, not every raw sample."""
+    # Shared edges keep the two overlaid distributions aligned bar for bar
+    edges = np.histogram_bin_edges(np.concatenate((player1_points, player2_points)), bins=nbins)
+    centers = (edges[:-1] + edges[1:]) / 2
+    widths = np.diff(edges)
+    counts1, _ = np.histogram(player1_points, bins=edges)
+    counts2, _ = np.histogram(player2_points, bins=edges)
+    with fig.batch_update():
+        fig.data[0].update(x=centers, y=counts1, width=widths)
+        fig.data[1].update(x=centers, y=counts2, width=widths)
+
+
+def update_running_stats(count, mean, m2, samples):
+    """Merge a batch of samples into running (count, mean, M2) totals, one per row of samples (Welford/Chan)."""
+    batch_count = samples.shape[-1]
+    batch_mean = samples.mean(axis=-1, dtype=np.float64)
+    batch_m2 = ((samples - batch_mean[:, None]) ** 2).sum(axis=-1, dtype=np.float64)
+    total = count + batch_count
+    delta = batch_mean - mean
+    mean = mean + delta * (batch_count / total)
+    m2 = m2 + batch_m2 + delta ** 2 * (count * batch_count / total)
+    return total, mean, m2
+
+
+def partition_median(values):
+    """Median of a 1-D array via an O(N) np.partition of the middle element(s)."""
+    middle = len(values) // 2
+    if len(values) % 2:
+        return np.partition(values, middle)[middle]
+    lower, upper = np.partition(values, (middle - 1, middle))[middle - 1:middle + 1]
+    return (float(lower) + float(upper)) / 2
+
+
 if st.sidebar.button("Run Simulation"):
-    player1_fantasy_points = []
-    player2_fantasy_points = []
+    player1_stats = get_player_stats_array(selected_player, selected_surface, player_data, stats_index, stats_table)
+    player2_stats = get_player_stats_array(selected_opponent, selected_surface, player_data, stats_index, stats_table)
+    if player1_stats is None or player2_stats is None:
+        st.error("Valid statistics could not be found for both players on this surface.")
+        st.stop()
+    total = num_simulations
+    player1_fantasy_points = np.empty(total, dtype=np.float32)
+    player2_fantasy_points = np.empty(total, dtype=np.float32)
     progress_bar = st.progress(0)
     status_text = st.empty()
     histogram_placeholder = st.empty()
-    total = num_simulations
-    batch_size = 5 
-    num_batches = total // batch_size
-    remainder = total % batch_size
-    for batch in range(num_batches):
-        for _ in range(batch_size):
-            match_result = run_match_simulation(
-                selected_player,
-                selected_opponent,
-                selected_surface,
-                player_data,
-                best_of=3
-            )
-            if match_result:
-                player1_fantasy_points.append(match_result['player1_fantasy_points'])
-                player2_fantasy_points.append(match_result['player2_fantasy_points'])
-        # Update progress
-        progress = (batch + 1) / num_batches
-        progress_bar.progress(min(progress, 1.0))
-        status_text.text(f"Simulating {min((batch + 1)*batch_size, total)} out of {total} matches...")
-
-        # Update histogram using Plotly for better performance
-        hist1 = go.Histogram(
-            x=player1_fantasy_points,
-            nbinsx=30,
-            name=selected_player,
-            opacity=0.6,
-            marker_color='blue'
+    histogram_fig = build_histogram_figure()
+    batch_size = 100  # Matches per parallel kernel call
+    num_batches = -(-total // batch_size)
+    update_every = -(-num_batches // max_progress_updates)
+    count, mean, m2 = 0, np.zeros(2), np.zeros(2)
+    last_plot = time.monotonic()
+    for batch, start in enumerate(range(0, total, batch_size)):
+        stop = min(start + batch_size, total)
+        player1_fantasy_points[start:stop], player2_fantasy_points[start:stop] = simulate_many(
+            stop - start,
+            player1_stats,
+            player2_stats,
+            best_of
         )
-        hist2 = go.Histogram(
-            x=player2_fantasy_points,
-            nbinsx=30,
-            name=selected_opponent,
-            opacity=0.6,
-            marker_color='orange'
+        count, mean, m2 = update_running_stats(
+            count, mean, m2,
+            np.stack((player1_fantasy_points[start:stop], player2_fantasy_points[start:stop]))
         )
 
-        layout = go.Layout(
-            title='Fantasy Points Distribution',
-            xaxis_title='Fantasy Points',
-            yaxis_title='Frequency',
-            barmode='overlay',
-            width=1600,   # Smaller width
-            height=600   # Smaller height
-        )
-
-        fig = go.Figure(data=[hist1, hist2], layout=layout)
-        histogram_placeholder.plotly_chart(fig, use_container_width=False)
-
-        # Allow Streamlit to update
-        time.sleep(0.001)  # Minimal sleep to ensure UI responsiveness
-    if remainder > 0:
-        for _ in range(remainder):
-            match_result = run_match_simulation(
-                selected_player,
-                selected_opponent,
-                selected_surface,
-                player_data,
-                best_of=3
+        # Update progress at most max_progress_updates times; each update is a round trip to the browser
+        if batch % update_every == 0 or batch == num_batches - 1:
+            std = np.sqrt(m2 / count)
+            progress_bar.progress(stop / total)
+            status_text.text(
+                f"Simulating {stop} out of {total} matches... "
+                f"{selected_player}: {mean[0]:.2f} ± {std[0]:.2f} | "
+                f"{selected_opponent}: {mean[1]:.2f} ± {std[1]:.2f}"
             )
-            if match_result:
-                player1_fantasy_points.append(match_result['player1_fantasy_points'])
-                player2_fantasy_points.append(match_result['player2_fantasy_points'])
-        progress_bar.progress(1.0)
-        status_text.text(f"Simulating {total} out of {total} matches...")
-        hist1 = go.Histogram(
-            x=player1_fantasy_points,
-            nbinsx=200,
-            name=selected_player,
-            opacity=0.6,
-            marker_color='blue'
-        )
-        hist2 = go.Histogram(
-            x=player2_fantasy_points,
-            nbinsx=200,
-            name=selected_opponent,
-            opacity=0.6,
-            marker_color='orange'
-        )
-        layout = go.Layout(
-            title='Fantasy Points Distribution',
-            xaxis_title='Fantasy Points',
-            yaxis_title='Frequency',
-            barmode='overlay',
-            width=1600, 
-            height=800 
-        )
-        fig = go.Figure(data=[hist1, hist2], layout=layout)
-        histogram_placeholder.plotly_chart(fig, use_container_width=False)
+
+        # Throttle partial renders so long runs don't flood the browser with redraws
+        if stop < total and time.monotonic() - last_plot > redraw_interval:
+            update_histogram(histogram_fig, player1_fantasy_points[:stop], player2_fantasy_points[:stop])
+            histogram_placeholder.plotly_chart(histogram_fig, use_container_width=False)
+            last_plot = time.monotonic()
+
+    # Render the final histogram once with the full results
+    update_histogram(histogram_fig, player1_fantasy_points, player2_fantasy_points, nbins=50)
+    histogram_placeholder.plotly_chart(histogram_fig, use_container_width=False)
     st.success(f"✅ Simulation completed: {total} matches simulated.")
     st.header("📊 Match Statistics")
+    std = np.sqrt(m2 / count)  # Population std dev, same as np.std
     col1, col2 = st.columns(2)
     with col1:
         st.subheader(f"{selected_player} Fantasy Points")
-        st.write(f"**Mean:** {np.mean(player1_fantasy_points):.2f}")
-        st.write(f"**Median:** {np.median(player1_fantasy_points):.2f}")
-        st.write(f"**Std Dev:** {np.std(player1_fantasy_points):.2f}")
+        st.write(f"**Mean:** {mean[0]:.2f}")
+        st.write(f"**Median:** {partition_median(player1_fantasy_points):.2f}")
+        st.write(f"**Std Dev:** {std[0]:.2f}")
     with col2:
         st.subheader(f"{selected_opponent} Fantasy Points")
-        st.write(f"**Mean:** {np.mean(player2_fantasy_points):.2f}")
-        st.write(f"**Median:** {np.median(player2_fantasy_points):.2f}")
-        st.write(f"**Std Dev:** {np.std(player2_fantasy_points):.2f}")
+        st.write(f"**Mean:** {mean[1]:.2f}")
+        st.write(f"**Median:** {partition_median(player2_fantasy_points):.2f}")
+        st.write(f"**Std Dev:** {std[1]:.2f}")
     
 
 st.sidebar.header("created by Dusty Schmidt")
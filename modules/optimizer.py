@@ -1,11 +1,22 @@
 # modules/optimizer.py
 
-from pulp import LpProblem, LpVariable, LpMaximize, lpSum, LpBinary, LpStatus
+import logging
+import numpy as np
+import pandas as pd
+from scipy.optimize import Bounds, LinearConstraint, milp
+
+# Largest (players x roster slots x salary steps) table the DP solver will allocate
+MAX_DP_CELLS = 50_000_000
+
 
 def optimize_lineup(lineup_data, salary_cap, roster_size=6):
     """
     Optimize DFS lineup based on projected fantasy points and salary cap.
 
+    The problem is a 0/1 knapsack with a cardinality constraint, so it is solved exactly with a
+    dynamic program over (roster slots, salary). The MILP solver is only used as a fallback when
+    salaries are not integers or the DP table would be too large.
+
     Args:
         lineup_data (pd.DataFrame): DataFrame containing player data with projected fantasy points.
             Expected columns: 'Name', 'salary', 'AverageFantasyPoints'
@@ -20,35 +31,105 @@ def optimize_lineup(lineup_data, salary_cap, roster_size=6):
     if not required_columns.issubset(lineup_data.columns):
         raise ValueError(f"lineup_data must contain columns: {required_columns}")
 
-    # Create the LP problem
-    prob = LpProblem("Lineup Optimization", LpMaximize)
+    salaries = lineup_data['salary'].to_numpy(dtype=np.float64)
+    points = lineup_data['AverageFantasyPoints'].to_numpy(dtype=np.float64)
 
-    # Create decision variables
-    player_vars = LpVariable.dicts("Player", lineup_data.index, cat=LpBinary)
+    integral = np.all(salaries == np.round(salaries)) and float(salary_cap) == round(salary_cap)
+    if not integral or np.any(salaries < 0) or salary_cap < 0:
+        return _optimize_lineup_lp(lineup_data, salary_cap, roster_size)
 
-    # Objective function: Maximize total projected fantasy points
-    prob += lpSum([lineup_data.loc[i, 'AverageFantasyPoints'] * player_vars[i] for i in lineup_data.index])
+    # Work in units of the common salary divisor (typically 100) to shrink the table
+    salaries = salaries.astype(np.int64)
+    unit = int(np.gcd.reduce(np.append(salaries, int(salary_cap)))) or 1
+    salaries //= unit
+    capacity = int(salary_cap) // unit
 
-    # Constraint: Total salary must be less than or equal to the salary cap
-    prob += lpSum([lineup_data.loc[i, 'salary'] * player_vars[i] for i in lineup_data.index]) <= salary_cap
+    if len(salaries) * (roster_size + 1) * (capacity + 1) > MAX_DP_CELLS:
+        return _optimize_lineup_lp(lineup_data, salary_cap, roster_size)
+
+    selected_positions = _solve_lineup_dp(salaries, points, capacity, roster_size)
+    if selected_positions is None:
+        # No optimal solution found
+        logging.warning("No optimal solution found for the lineup optimization.")
+        return pd.DataFrame()
+
+    return lineup_data.iloc[selected_positions].reset_index(drop=True)
+
+
+def _solve_lineup_dp(salaries, points, capacity, roster_size):
+    """
+    Exact cardinality-constrained knapsack.
 
-    # Constraint: Roster size (e.g., select 6 players)
-    prob += lpSum([player_vars[i] for i in lineup_data.index]) == roster_size
+    best[k, s] holds the highest projected points using exactly k players with total salary at
+    most s. Each player's update is vectorized over the salary axis, iterating k downward so a
+    player is used at most once.
+
+    Returns:
+        Optional[List[int]]: Row positions of the selected players, or None if infeasible.
+    """
+    n_players = len(salaries)
+    best = np.full((roster_size + 1, capacity + 1), -np.inf)
+    best[0, :] = 0.0
+    taken = np.zeros((n_players, roster_size + 1, capacity + 1), dtype=bool)
+
+    for i in range(n_players):
+        salary = salaries[i]
+        if salary > capacity:
+            continue
+        for k in range(min(i + 1, roster_size), 0, -1):
+            candidate = best[k - 1, :capacity + 1 - salary] + points[i]
+            improved = candidate > best[k, salary:]
+            best[k, salary:][improved] = candidate[improved]
+            taken[i, k, salary:] = improved
+
+    if not np.isfinite(best[roster_size, capacity]):
+        return None
+
+    # Walk the decisions backwards to recover the chosen players
+    selected = []
+    k, s = roster_size, capacity
+    for i in range(n_players - 1, -1, -1):
+        if k == 0:
+            break
+        if taken[i, k, s]:
+            selected.append(i)
+            s -= salaries[i]
+            k -= 1
+    return sorted(selected)
+
+
+def _optimize_lineup_lp(lineup_data, salary_cap, roster_size):
+    """
+    Solve the lineup as a MILP with HiGHS (in-process via SciPy); used when the DP is not applicable.
+    """
+    points = lineup_data['AverageFantasyPoints'].to_numpy(dtype=np.float64)
+    salaries = lineup_data['salary'].to_numpy(dtype=np.float64)
+    n_players = len(points)
 
-    # Solve the problem
-    prob.solve()
+    constraints = [
+        # Constraint: Total salary must be less than or equal to the salary cap
+        LinearConstraint(salaries.reshape(1, -1), -np.inf, salary_cap),
+        # Constraint: Roster size (e.g., select 6 players)
+        LinearConstraint(np.ones((1, n_players)), roster_size, roster_size)
+    ]
+    result = milp(
+        -points,  # Objective function: Maximize total projected fantasy points (milp minimizes)
+        constraints=constraints,
+        integrality=np.ones(n_players),
+        bounds=Bounds(0, 1)
+    )
 
     # Log optimizer status
-    logging.info(f"Optimizer Status: {LpStatus[prob.status]}")
+    logging.info(f"Optimizer Status: {result.message}")
 
     # Check if a valid solution was found
-    if prob.status != 1:
+    if not result.success:
         # No optimal solution found
         logging.warning("No optimal solution found for the lineup optimization.")
         return pd.DataFrame()
 
     # Get the selected players
-    selected_indices = [i for i in lineup_data.index if player_vars[i].varValue == 1]
-    selected_players = lineup_data.loc[selected_indices].reset_index(drop=True)
+    selected_positions = np.flatnonzero(result.x > 0.5)
+    selected_players = lineup_data.iloc[selected_positions].reset_index(drop=True)
 
     return selected_players
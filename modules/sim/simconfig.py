@@ -1,7 +1,11 @@
 # modules/sim/simconfig.py
 
+import os
+import weakref
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict, Any, ClassVar, List
+from pathlib import Path
+from typing import Optional, Dict, Any, ClassVar, List, Sequence, Tuple
 from dataclasses import dataclass
 import logging
 
@@ -10,6 +14,24 @@ from utils.logger import SIM_LOG_MESSAGES, get_logger
 # Initialize logger
 sim_logger = get_logger('simulation')
 
+# Count-based match statistics consumed by the fantasy points calculators
+FANTASY_STAT_FIELDS: List[str] = [
+    'MatchPlayed',
+    'AdvancedByWalkover',
+    'Aces',
+    'DoubleFaults',
+    'GamesWon',
+    'GamesLost',
+    'SetsWon',
+    'SetsLost',
+    'CleanSet',
+    'StraightSets',
+    'NoDoubleFault',
+    'TenPlusAces',
+    'FifteenPlusAces',
+    'Breaks'
+]
+
 
 @dataclass
 class PlayerStats:
@@ -81,13 +103,55 @@ class PlayerStats:
                     player_name=self.Player
                 ))
                 raise ValueError(f"Missing required field: {field_name}")
-            if isinstance(value, float) and not (0.0 <= value <= 1.0):
+            if isinstance(value, (float, np.floating)) and not (0.0 <= value <= 1.0):
                 sim_logger.error(SIM_LOG_MESSAGES["invalid_stat_value"].format(
                     field=field_name,
                     player_name=self.Player
                 ))
                 raise ValueError(f"Invalid value for {field_name}: {value}. Must be between 0 and 1.")
 
+    @classmethod
+    def from_row_unchecked(cls, row: Any) -> 'PlayerStats':
+        """
+        Build a PlayerStats from a row that was already validated at load time, skipping __post_init__.
+
+        Args:
+            row (Any): pd.Series or mapping providing every field in REQUIRED_FIELDS.
+
+        Returns:
+            PlayerStats: Instance populated from the row.
+        """
+        stats = cls.__new__(cls)
+        for field_name in cls.REQUIRED_FIELDS:
+            object.__setattr__(stats, field_name, row[field_name])
+        return stats
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, List[Any]], position: int) -> 'PlayerStats':
+        """
+        Build a PlayerStats from one row of per-field column lists, skipping __post_init__.
+
+        Args:
+            columns (Dict[str, List[Any]]): Column values keyed by REQUIRED_FIELDS, as built by build_stats_map.
+            position (int): Row position in player_data, as stored in the stats index.
+
+        Returns:
+            PlayerStats: Instance populated from the row.
+        """
+        stats = cls.__new__(cls)
+        for field_name in cls.REQUIRED_FIELDS:
+            object.__setattr__(stats, field_name, columns[field_name][position])
+        return stats
+
+    def to_array(self) -> np.ndarray:
+        """
+        Pack the serve rates into the flat array layout used by the compiled kernels.
+
+        Returns:
+            np.ndarray: Float32 array of shape (len(SERVE_COLS),) in SERVE_COLS order.
+        """
+        return np.array([getattr(self, field_name) for field_name in SERVE_COLS], dtype=np.float32)
+
     def reset_match_stats(self):
         """
         Reset match-specific statistics to their default values before starting a new match.
@@ -95,6 +159,66 @@ class PlayerStats:
         pass  # No action needed as counts are handled in simulator.py
 
 
+# Numeric rate stats in the fixed column order of get_player_stats_array
+RATE_COLS: List[str] = [field for field in PlayerStats.REQUIRED_FIELDS if field not in ('Player', 'Surface', 'League')]
+
+# The rates read by the point model, in the packed order the compiled kernels take them
+SERVE_COLS: List[str] = [
+    'FirstServePercentage',
+    'AcePercentage',
+    'FirstServeWonPercentage',
+    'DoubleFaultPercentage',
+    'SecondServeWonPercentage'
+]
+
+
+# Loaded player data per CSV path: (file mtime, DataFrame, stats index, opponent groups, stats table)
+_player_data_cache: Dict[
+    str, Tuple[float, pd.DataFrame, Dict[Tuple[str, str], Optional[int]], Dict[Tuple[str, str], Tuple[str, ...]], np.ndarray]
+] = {}
+
+
+# Parquet schema metadata key holding the '<st_mtime_ns>:<st_size>' of the CSV a copy was written from
+_PARQUET_SOURCE_KEY = b'tennis_sim.source_csv'
+
+
+def _read_player_table(filepath: str) -> pd.DataFrame:
+    """
+    Read the raw player CSV, reusing a Parquet copy stored next to it when it was written from
+    this exact file.
+
+    The copy records the CSV's modification time (in ns) and size and is only used on an exact
+    match, so replacing the CSV invalidates it even when the new file carries an older mtime.
+    Note that reading has a side effect: when pyarrow is installed, a missing or stale copy is
+    (re)written as <name>.parquet in the CSV's directory.
+    """
+    csv_path = Path(filepath)
+    parquet_path = csv_path.with_suffix('.parquet')
+    source = None
+    try:
+        csv_stat = csv_path.stat()
+        source = f'{csv_stat.st_mtime_ns}:{csv_stat.st_size}'.encode()
+        if parquet_path.exists():
+            import pyarrow.parquet as pq
+            if (pq.read_schema(parquet_path).metadata or {}).get(_PARQUET_SOURCE_KEY) == source:
+                return pd.read_parquet(parquet_path)
+    except (ImportError, OSError, ValueError):
+        pass  # Missing CSV, or an unreadable or unsupported Parquet copy; read the CSV
+
+    # Rate stats are percentages in [0, 1]; float32 halves their memory footprint
+    player_data = pd.read_csv(filepath, dtype={col: 'float32' for col in RATE_COLS})
+    if source is not None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(player_data, preserve_index=False)
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}), _PARQUET_SOURCE_KEY: source})
+            pq.write_table(table, parquet_path)
+        except (ImportError, OSError, ValueError):
+            pass  # Parquet support is optional; the CSV is read again next time
+    return player_data
+
+
 def load_player_data(filepath: str) -> pd.DataFrame:
     """
     Load player statistics from a CSV file, utilizing only rate (percentage-based) stats.
@@ -106,45 +230,36 @@ def load_player_data(filepath: str) -> pd.DataFrame:
         pd.DataFrame: DataFrame containing player statistics.
     """
     try:
-        player_data = pd.read_csv(filepath)
-        player_data = player_data.copy()  # Work on a copy to avoid SettingWithCopyWarning
+        player_data = _read_player_table(filepath)
 
         # Ensure all required columns are present
-        required_columns = [
-            'Player',
-            'Surface',
-            'League',
-            'FirstServePercentage',
-            'AcePercentage',
-            'FirstServeWonPercentage',
-            'SecondServeWonPercentage',
-            'DoubleFaultPercentage',
-            'ServiceGamesWonPercentage',
-            'ReturnGamesWonPercentage',
-            'PointsWonPercentage',
-            'GamesWonPercentage',
-            'SetsWonPercentage',
-            'TieBreaksWonPercentage',
-            'BreakPointsSavedPercentage',
-            'BreakPointsConvertedPercentage',
-            'FirstServeReturnPointsWonPercentage',
-            'SecondServeReturnPointsWonPercentage',
-            'ReturnPointsWonPercentage',
-            'ServicePointsWonPercentage',
-            'BreakPointsFacedPerServiceGame',
-            'AceAgainstPercentage',
-            'AcesAgainstPerReturnGame',
-            'BreakPointChancesPerReturnGame'
-        ]
-        missing_columns = [col for col in required_columns if col not in player_data.columns]
+        missing_columns = sorted(frozenset(PlayerStats.REQUIRED_FIELDS) - set(player_data.columns))
         if missing_columns:
             sim_logger.error(SIM_LOG_MESSAGES["missing_columns_error"].format(
                 columns=', '.join(missing_columns)
             ))
             raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
 
-        # Standardize the 'Player' column to lowercase for case-insensitive matching
+        # Standardize the 'Player' and 'Surface' columns to lowercase for case-insensitive matching
         player_data['Player_lower'] = player_data['Player'].str.lower()
+        player_data['Surface_lower'] = player_data['Surface'].str.lower()
+
+        # Derive the tour category from the league name
+        league = player_data['League']
+        player_data['Category'] = np.where(
+            league.str.contains('ATP', case=False, regex=False, na=False), 'ATP',
+            np.where(league.str.contains('WTA', case=False, regex=False, na=False), 'WTA', 'Unknown')
+        )
+
+        # Validate every rate stat in one vectorized pass instead of per PlayerStats instance; invalid
+        # rows stay in the frame but are flagged; the stats index maps them to None and the opponent
+        # groups leave them out
+        rates = player_data[RATE_COLS]
+        player_data['ValidStats'] = ((rates >= 0.0) & (rates <= 1.0)).all(axis=1)
+        if not player_data['ValidStats'].all():
+            sim_logger.warning(SIM_LOG_MESSAGES["invalid_stats_rows"].format(
+                count=int((~player_data['ValidStats']).sum())
+            ))
 
         sim_logger.info(SIM_LOG_MESSAGES["load_player_data"].format(filepath=filepath))
         return player_data
@@ -154,7 +269,181 @@ def load_player_data(filepath: str) -> pd.DataFrame:
         return pd.DataFrame()
 
 
-def get_player_stats(player_name: str, surface: str, player_data: pd.DataFrame) -> Optional[pd.Series]:
+def load_player_data_cached(filepath: str) -> Tuple[
+    pd.DataFrame, Dict[Tuple[str, str], Optional[int]], Dict[Tuple[str, str], Tuple[str, ...]], np.ndarray
+]:
+    """
+    Load player data, its stats index, the opponent groups and the stats table once per file version.
+
+    The result is kept in a module-level cache and only reloaded when the file's
+    modification time changes, so repeated Streamlit reruns skip both parsing and
+    the hash/serialize round trip of st.cache_data.
+
+    Args:
+        filepath (str): Path to the CSV file.
+
+    Returns:
+        Tuple[pd.DataFrame, Dict[Tuple[str, str], Optional[int]], Dict[Tuple[str, str], Tuple[str, ...]], np.ndarray]:
+            Player data, the index returned by build_stats_index, the groups returned by
+            build_opponent_groups and the table returned by build_stats_table. All are shared
+            between callers and should be treated as read-only.
+    """
+    empty_table = np.empty((0, len(RATE_COLS)), dtype=np.float32)
+    try:
+        mtime = os.stat(filepath).st_mtime
+    except OSError:
+        return load_player_data(filepath), {}, {}, empty_table  # Logs the load error and returns an empty frame
+
+    cached = _player_data_cache.get(filepath)
+    if cached is None or cached[0] != mtime:
+        player_data = load_player_data(filepath)
+        if player_data.empty:
+            cached = (mtime, player_data, {}, {}, empty_table)
+        else:
+            cached = (mtime, player_data, build_stats_index(player_data), build_opponent_groups(player_data),
+                      build_stats_table(player_data))
+        _player_data_cache[filepath] = cached
+    return cached[1], cached[2], cached[3], cached[4]
+
+
+def build_stats_index(player_data: pd.DataFrame) -> Dict[Tuple[str, str], Optional[int]]:
+    """
+    Precompute a lookup of row positions for every (player, surface) row.
+
+    Rows flagged invalid by load_player_data (any rate stat missing or outside [0, 1]) map to
+    None, so rows reached through the index can skip PlayerStats validation and lookups can tell
+    an invalid surface row apart from a missing one.
+
+    Args:
+        player_data (pd.DataFrame): DataFrame returned by load_player_data.
+
+    Returns:
+        Dict[Tuple[str, str], Optional[int]]: Mapping of (player_lower, surface_lower) to the row
+            position in player_data, or None for invalid rows.
+    """
+    stats_index = {}
+    keys = zip(player_data['Player_lower'], player_data['Surface_lower'])
+    for position, (key, ok) in enumerate(zip(keys, player_data['ValidStats'])):
+        stats_index.setdefault(key, position if ok else None)  # First row wins, as with a filtered .iloc[0]
+    return stats_index
+
+
+def build_stats_map(player_data: pd.DataFrame,
+                    stats_index: Dict[Tuple[str, str], Optional[int]]) -> Dict[Tuple[str, str], Optional[PlayerStats]]:
+    """
+    Build every indexed player's PlayerStats once, so repeated simulations skip pandas entirely.
+
+    Each field is extracted once as a plain list, so the stats hold native Python floats, which
+    the reference simulation compares faster than the NumPy scalars a pandas row yields.
+
+    Args:
+        player_data (pd.DataFrame): DataFrame returned by load_player_data.
+        stats_index (Dict[Tuple[str, str], Optional[int]]): Index returned by build_stats_index.
+
+    Returns:
+        Dict[Tuple[str, str], Optional[PlayerStats]]: Mapping of (player_lower, surface_lower) to
+            PlayerStats, or None for the invalid rows of the index.
+    """
+    columns = {field_name: player_data[field_name].tolist() for field_name in PlayerStats.REQUIRED_FIELDS}
+    return {key: None if position is None else PlayerStats.from_columns(columns, position)
+            for key, position in stats_index.items()}
+
+
+# Stats index for the last frame get_stats_index saw that load_player_data_cached doesn't hold
+_last_stats_index: Optional[Tuple[weakref.ref, Dict[Tuple[str, str], Optional[int]]]] = None
+
+
+def get_stats_index(player_data: pd.DataFrame) -> Dict[Tuple[str, str], Optional[int]]:
+    """
+    Return the stats index for player_data without rebuilding it on every call.
+
+    Frames returned by load_player_data_cached reuse the index cached alongside them; any other
+    frame keeps its index until a different frame is passed in. Either way the frame must not be
+    modified afterwards, as with the shared cached frames.
+
+    Args:
+        player_data (pd.DataFrame): DataFrame returned by load_player_data.
+
+    Returns:
+        Dict[Tuple[str, str], Optional[int]]: Index in the format of build_stats_index.
+    """
+    global _last_stats_index
+    for cached in _player_data_cache.values():
+        if cached[1] is player_data:
+            return cached[2]
+    if _last_stats_index is not None and _last_stats_index[0]() is player_data:
+        return _last_stats_index[1]
+
+    stats_index = build_stats_index(player_data)
+    _last_stats_index = (weakref.ref(player_data), stats_index)
+    return stats_index
+
+
+def build_stats_table(player_data: pd.DataFrame) -> np.ndarray:
+    """
+    Copy the rate stats into one contiguous float32 array, so the compiled kernel's inputs can be
+    read by row position instead of through a DataFrame selection per player.
+
+    Args:
+        player_data (pd.DataFrame): DataFrame returned by load_player_data.
+
+    Returns:
+        np.ndarray: Float32 array of shape (len(player_data), len(RATE_COLS)) in RATE_COLS order,
+            with rows at the positions held in the stats index.
+    """
+    return np.ascontiguousarray(player_data[RATE_COLS].to_numpy(dtype=np.float32))
+
+
+def build_opponent_groups(player_data: pd.DataFrame) -> Dict[Tuple[str, str], Tuple[str, ...]]:
+    """
+    Group player names by (Category, Surface) so opponent lists don't need a scan per rerun.
+
+    Only rows with valid stats are grouped, so every listed opponent resolves through the stats index.
+
+    Args:
+        player_data (pd.DataFrame): DataFrame returned by load_player_data.
+
+    Returns:
+        Dict[Tuple[str, str], Tuple[str, ...]]: Sorted unique player names for each
+            (Category, Surface) pair.
+    """
+    valid_rows = player_data[player_data['ValidStats']]
+    return {
+        (category, surface): tuple(sorted(group.unique()))
+        for (category, surface), group in valid_rows.groupby(['Category', 'Surface'])['Player']
+    }
+
+
+def _find_row(player_name: str, surface: str, stats_index: Dict[Tuple[str, str], Any]) -> Optional[Any]:
+    """
+    Look up a player's entry (a row position or a prebuilt PlayerStats), falling back to their
+    'All' surfaces entry only when they have no row for the surface. Every miss, invalid row and
+    fallback is logged.
+    """
+    player_name_lower = player_name.lower()
+    key = (player_name_lower, surface.lower())
+    if key not in stats_index:
+        key = (player_name_lower, 'all')
+        if key not in stats_index:
+            sim_logger.warning(SIM_LOG_MESSAGES["get_player_stats_warning"].format(
+                player_name=player_name, surface=surface
+            ))
+            return None
+        if surface.lower() != 'all':
+            sim_logger.warning(SIM_LOG_MESSAGES["get_player_stats_fallback"].format(
+                player_name=player_name, surface=surface
+            ))
+
+    position = stats_index[key]
+    if position is None:
+        sim_logger.warning(SIM_LOG_MESSAGES["get_player_stats_invalid"].format(
+            player_name=player_name, surface=key[1]
+        ))
+    return position
+
+
+def get_player_stats(player_name: str, surface: str, player_data: pd.DataFrame,
+                     stats_index: Optional[Dict[Tuple[str, str], Optional[int]]] = None) -> Optional[pd.Series]:
     """
     Retrieve player statistics based on name and surface.
 
@@ -162,33 +451,116 @@ def get_player_stats(player_name: str, surface: str, player_data: pd.DataFrame)
         player_name (str): Name of the player.
         surface (str): Surface type ('Hard', 'Clay', 'Grass', or 'All').
         player_data (pd.DataFrame): DataFrame containing player statistics.
+        stats_index (Optional[Dict[Tuple[str, str], Optional[int]]]): Index returned by build_stats_index.
+            Taken from get_stats_index when omitted.
 
     Returns:
         Optional[pd.Series]: Player statistics if found, else None.
     """
-    player_name_lower = player_name.lower()
-    surface_lower = surface.lower()
+    if stats_index is None:
+        stats_index = get_stats_index(player_data)
 
-    # Filter based on the standardized 'Player_lower' name and 'Surface'
-    player_row = player_data[
-        (player_data['Player_lower'] == player_name_lower) &
-        (player_data['Surface'].str.lower() == surface_lower)
-    ]
+    position = _find_row(player_name, surface, stats_index)
+    if position is None:
+        return None
+    return player_data.iloc[position]  # Return a single row as a Series
 
-    if player_row.empty:
-        # Attempt to find stats with 'All' surfaces
-        player_row = player_data[
-            (player_data['Player_lower'] == player_name_lower) &
-            (player_data['Surface'].str.lower() == 'all')
-        ]
 
-    if player_row.empty:
-        sim_logger.warning(SIM_LOG_MESSAGES["get_player_stats_warning"].format(
-            player_name=player_name, surface=surface
-        ))
-        return None
+def lookup_player_stats(player_name: str, surface: str,
+                        stats_map: Dict[Tuple[str, str], Optional[PlayerStats]]) -> Optional[PlayerStats]:
+    """
+    Retrieve a player's prebuilt PlayerStats, with the same 'All' surfaces fallback as get_player_stats.
+
+    Args:
+        player_name (str): Name of the player.
+        surface (str): Surface type ('Hard', 'Clay', 'Grass', or 'All').
+        stats_map (Dict[Tuple[str, str], Optional[PlayerStats]]): Mapping returned by build_stats_map.
 
-    return player_row.iloc[0]  # Return a single row as a Series
+    Returns:
+        Optional[PlayerStats]: Player statistics if found, else None.
+    """
+    return _find_row(player_name, surface, stats_map)
+
+
+def get_player_stats_array(player_name: str, surface: str, player_data: pd.DataFrame,
+                           stats_index: Dict[Tuple[str, str], Optional[int]],
+                           stats_table: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+    """
+    Retrieve a player's rate stats as a float32 array for the compiled simulation kernel.
+
+    Args:
+        player_name (str): Name of the player.
+        surface (str): Surface type ('Hard', 'Clay', 'Grass', or 'All').
+        player_data (pd.DataFrame): DataFrame containing player statistics.
+        stats_index (Dict[Tuple[str, str], Optional[int]]): Index returned by build_stats_index.
+        stats_table (Optional[np.ndarray]): Table returned by build_stats_table. When given, the
+            row is read from it and player_data is not touched.
+
+    Returns:
+        Optional[np.ndarray]: Rate stats in RATE_COLS order if found, else None.
+    """
+    position = _find_row(player_name, surface, stats_index)
+    if position is None:
+        return None
+    if stats_table is not None:
+        return stats_table[position]
+    return player_data[RATE_COLS].iloc[position].to_numpy(dtype=np.float32)
+
+
+def _fantasy_points_base(stats: Dict[str, Any], match_won: Any) -> Any:
+    """Format-independent DraftKings points only; used for best_of values other than 3 or 5."""
+    return (
+        30 * stats.get('MatchPlayed', 0)           # Match Played
+        + 30 * stats.get('AdvancedByWalkover', 0)  # Advanced By Walkover
+        - stats.get('DoubleFaults', 0)             # Double Fault
+        + 2 * stats.get('TenPlusAces', 0)          # 10+ Ace Bonus
+        + 2 * stats.get('FifteenPlusAces', 0)      # 15+ Ace Bonus
+    )
+
+
+def _fantasy_points_bo3(stats: Dict[str, Any], match_won: Any) -> Any:
+    """DraftKings points for a best of 3 match. Works on scalars and on NumPy arrays alike."""
+    return (
+        30 * stats.get('MatchPlayed', 0)           # Match Played
+        + 30 * stats.get('AdvancedByWalkover', 0)  # Advanced By Walkover
+        + 6 * match_won                            # Match Won
+        + 2.5 * stats.get('GamesWon', 0)           # Game Won
+        - 2 * stats.get('GamesLost', 0)            # Game Lost
+        + 6 * stats.get('SetsWon', 0)              # Set Won
+        - 3 * stats.get('SetsLost', 0)             # Set Lost
+        + 0.4 * stats.get('Aces', 0)               # Ace
+        - stats.get('DoubleFaults', 0)             # Double Fault
+        + 0.75 * stats.get('Breaks', 0)            # Break Point Converted
+        + 4 * stats.get('CleanSet', 0)             # Clean Set Bonus
+        + 6 * stats.get('StraightSets', 0)         # Straight Sets Bonus
+        + 2.5 * stats.get('NoDoubleFault', 0)      # No Double Fault Bonus
+        + 2 * stats.get('TenPlusAces', 0)          # 10+ Ace Bonus
+        + 2 * stats.get('FifteenPlusAces', 0)      # 15+ Ace Bonus
+    )
+
+
+def _fantasy_points_bo5(stats: Dict[str, Any], match_won: Any) -> Any:
+    """DraftKings points for a best of 5 match. Works on scalars and on NumPy arrays alike."""
+    return (
+        30 * stats.get('MatchPlayed', 0)           # Match Played
+        + 30 * stats.get('AdvancedByWalkover', 0)  # Advanced By Walkover
+        + 5 * match_won                            # Match Won
+        + 2 * stats.get('GamesWon', 0)             # Game Won
+        - 1.6 * stats.get('GamesLost', 0)          # Game Lost
+        + 5 * stats.get('SetsWon', 0)              # Set Won
+        - 2.5 * stats.get('SetsLost', 0)           # Set Lost
+        + 0.25 * stats.get('Aces', 0)              # Ace
+        - stats.get('DoubleFaults', 0)             # Double Fault
+        + 0.5 * stats.get('Breaks', 0)             # Break Point Converted
+        + 2.5 * stats.get('CleanSet', 0)           # Clean Set Bonus
+        + 5 * stats.get('StraightSets', 0)         # Straight Sets Bonus
+        + 5 * stats.get('NoDoubleFault', 0)        # No Double Fault Bonus
+        + 2 * stats.get('TenPlusAces', 0)          # 10+ Ace Bonus
+        + 2 * stats.get('FifteenPlusAces', 0)      # 15+ Ace Bonus
+    )
+
+
+_FANTASY_SCORERS = {3: _fantasy_points_bo3, 5: _fantasy_points_bo5}
 
 
 def calculate_fantasy_points(stats: Dict[str, Any], match_won: bool, best_of: int) -> float:
@@ -218,84 +590,56 @@ def calculate_fantasy_points(stats: Dict[str, Any], match_won: bool, best_of: in
     Returns:
         float: Calculated fantasy points.
     """
-    points = 0.0
-
-    # Base Points
-    if stats.get('MatchPlayed', False):
-        points += 30  # Match Played
-
-    if stats.get('AdvancedByWalkover', False):
-        points += 30  # Advanced By Walkover
-
-    # Match Outcome
-    if match_won:
-        if best_of == 3:
-            points += 6  # Match Won for Best of 3
-        elif best_of == 5:
-            points += 5  # Match Won for Best of 5
-
-    # Games
-    games_won = stats.get('GamesWon', 0)
-    games_lost = stats.get('GamesLost', 0)
-    if best_of == 3:
-        points += games_won * 2.5  # Game Won
-        points -= games_lost * 2    # Game Lost
-    elif best_of == 5:
-        points += games_won * 2      # Game Won
-        points -= games_lost * 1.6  # Game Lost
-
-    # Sets
-    sets_won = stats.get('SetsWon', 0)
-    sets_lost = stats.get('SetsLost', 0)
-    if best_of == 3:
-        points += sets_won * 6    # Set Won
-        points -= sets_lost * 3   # Set Lost
-    elif best_of == 5:
-        points += sets_won * 5    # Set Won
-        points -= sets_lost * 2.5  # Set Lost
-
-    # Aces
-    aces = stats.get('Aces', 0)
-    if best_of == 3:
-        points += aces * 0.4  # Ace
-    elif best_of == 5:
-        points += aces * 0.25  # Ace
-
-    # Double Faults
-    double_faults = stats.get('DoubleFaults', 0)
-    points -= double_faults * 1  # Double Fault
-
-    # Breaks
-    breaks = stats.get('Breaks', 0)
-    if best_of == 3:
-        points += breaks * 0.75  # Break Point Converted
-    elif best_of == 5:
-        points += breaks * 0.5  # Break Point Converted
-
-    # Bonuses
-    if stats.get('CleanSet', False):
-        if best_of == 3:
-            points += 4  # Clean Set Bonus for Best of 3
-        elif best_of == 5:
-            points += 2.5  # Clean Set Bonus for Best of 5
-
-    if stats.get('StraightSets', False):
-        if best_of == 3:
-            points += 6  # Straight Sets Bonus for Best of 3
-        elif best_of == 5:
-            points += 5  # Straight Sets Bonus for Best of 5
-
-    if stats.get('NoDoubleFault', False):
-        if best_of == 3:
-            points += 2.5  # No Double Fault Bonus for Best of 3
-        elif best_of == 5:
-            points += 5    # No Double Fault Bonus for Best of 5
-
-    if stats.get('TenPlusAces', False):
-        points += 2  # 10+ Ace Bonus
-
-    if stats.get('FifteenPlusAces', False):
-        points += 2  # 15+ Ace Bonus
-
-    sim_logger.debug(f"Calculating fantasy points: {points} from stats: {stats}, Match Won: {match_won}, Best of: {best_of}")
+    # Pick the scoring table once; the per-format functions have their constants baked in
+    scorer = _FANTASY_SCORERS.get(best_of, _fantasy_points_base)
+    points = float(scorer(stats, match_won))
+
+    if sim_logger.isEnabledFor(logging.DEBUG):
+        sim_logger.debug(
+            "Calculating fantasy points: %s from stats: %s, Match Won: %s, Best of: %s",
+            points, stats, match_won, best_of
+        )
     return points
+
+
+def calculate_fantasy_points_vec(stats: Dict[str, np.ndarray], match_won: np.ndarray, best_of: int) -> np.ndarray:
+    """
+    Vectorized version of calculate_fantasy_points over a batch of simulated matches.
+
+    Args:
+        stats (Dict[str, np.ndarray]): Arrays of shape (N,) keyed by the fields in FANTASY_STAT_FIELDS.
+            Missing keys are treated as zero, mirroring the dict.get defaults of the scalar version.
+        match_won (np.ndarray): Boolean array of shape (N,) indicating whether the player won each match.
+        best_of (int): Number of sets to play (3 or 5).
+
+    Returns:
+        np.ndarray: Float array of shape (N,) with the fantasy points for each match.
+    """
+    match_won = np.asarray(match_won, dtype=bool)
+    columns = {key: np.asarray(value, dtype=np.float64) for key, value in stats.items()}
+    scorer = _FANTASY_SCORERS.get(best_of, _fantasy_points_base)
+    # Broadcast so formats that ignore match_won still return one value per match
+    return np.broadcast_to(scorer(columns, match_won), match_won.shape).astype(np.float64)
+
+
+def fantasy_point_weights(fields: Sequence[str], best_of: int) -> np.ndarray:
+    """
+    Per-unit DraftKings multipliers for scoring many matches with a single matrix product.
+
+    The scoring functions are linear in the stats, so each weight is the points one unit of that
+    field adds on its own (an all-zero stat line scores nothing). The weights are read from the
+    scorers themselves, so the scoring table is still defined in one place.
+
+    Args:
+        fields (Sequence[str]): Stat names from FANTASY_STAT_FIELDS, or 'MatchWon' for the
+            match_won term.
+        best_of (int): Number of sets to play (3 or 5).
+
+    Returns:
+        np.ndarray: Float array of shape (len(fields),) aligned with fields.
+    """
+    scorer = _FANTASY_SCORERS.get(best_of, _fantasy_points_base)
+    return np.array(
+        [scorer({}, 1) if field == 'MatchWon' else scorer({field: 1}, 0) for field in fields],
+        dtype=np.float64
+    )
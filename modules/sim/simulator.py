@@ -1,69 +1,233 @@
 # modules/sim/simulator.py
 
+import os
 import time
 import numpy as np
-from typing import Dict, Optional, List, Any
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+from operator import methodcaller
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, NamedTuple, Optional, Any, Tuple
 import logging
-import pandas as pd
 
 from modules.sim.simconfig import (
     PlayerStats,
-    calculate_fantasy_points,
+    RATE_COLS,
+    SERVE_COLS,
+    fantasy_point_weights,
     get_player_stats,
+    get_stats_index,
+    lookup_player_stats,
     SIM_LOG_MESSAGES,
     sim_logger
 )
 
+if TYPE_CHECKING:  # Only needed for annotations; callers already hold the DataFrame
+    import pandas as pd
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; the kernels below then run as plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
+# Per-player counters produced by the compiled match kernel, in column order
+COUNTERS = (
+    'MatchWon',
+    'Aces',
+    'DoubleFaults',
+    'GamesWon',
+    'GamesLost',
+    'SetsWon',
+    'SetsLost',
+    'Breaks',
+    'CleanSet',
+    'StraightSets'
+)
+N_COUNTERS = len(COUNTERS)
+(_MATCH_WON, _ACES, _DOUBLE_FAULTS, _GAMES_WON, _GAMES_LOST,
+ _SETS_WON, _SETS_LOST, _BREAKS, _CLEAN_SET, _STRAIGHT_SETS) = range(N_COUNTERS)
+
+# Positions of the serve rates in RATE_COLS rows and in the packed SERVE_COLS arrays
+_SERVE_POSITIONS = [RATE_COLS.index(col) for col in SERVE_COLS]
+_FIRST_SERVE, _ACE, _FIRST_SERVE_WON, _DOUBLE_FAULT, _SECOND_SERVE_WON = range(len(SERVE_COLS))
+
+
+class GameResult(NamedTuple):
+    """Outcome of one game from simulate_game."""
+    winner: str
+    aces: int
+    double_faults: int
+    break_point_converted: bool
+
+
+class TieBreakResult(NamedTuple):
+    """Outcome of one tie-break from simulate_tie_break."""
+    winner: str
+    player1_aces: int
+    player2_aces: int
+    player1_double_faults: int
+    player2_double_faults: int
+
+
+class SetResult(NamedTuple):
+    """Outcome of one set from simulate_set."""
+    set_winner: str
+    games: List[str]
+    clean_set: bool
+    player1_aces: int
+    player2_aces: int
+    player1_double_faults: int
+    player2_double_faults: int
+    player1_breaks: int
+    player2_breaks: int
+    player1_games: int
+    player2_games: int
+
 
-def simulate_point(server: PlayerStats, returner: PlayerStats, is_break_point: bool = False) -> str:
+# Result keys for the two players, indexed 0 (player1) and 1 (player2)
+_PLAYER_KEYS = ('player1', 'player2')
+
+# Game score names for 0-3 points won; later points are shown as '40+'
+_SCORE_MAP = ('0', '15', '30', '40')
+
+# Tie-break serve order relative to the first server, repeating every four points: the first
+# server serves one point, then players alternate every two points
+_TIE_BREAK_ROTATION = (0, 1, 1, 0)
+_TIE_BREAK_CYCLE = np.array(_TIE_BREAK_ROTATION, dtype=np.int64)  # Same table for the kernel and batch paths
+
+
+def _serve_array(stats: np.ndarray) -> np.ndarray:
     """
-    Simulates a single point between server and returner, considering break points.
+    Return the contiguous float32 SERVE_COLS array used by the kernels, packing RATE_COLS rows
+    (get_player_stats_array) and passing through already packed arrays (PlayerStats.to_array).
+    """
+    stats = np.asarray(stats, dtype=np.float32)
+    if stats.shape[-1] == len(SERVE_COLS):
+        return np.ascontiguousarray(stats)
+    return np.ascontiguousarray(stats[_SERVE_POSITIONS])
+
+
+# Cached debug switch guarding every sim_logger.debug call in the reference simulation; call
+# refresh_debug_flag() after changing sim_logger's level
+_DEBUG = sim_logger.isEnabledFor(logging.DEBUG)
+
+
+def refresh_debug_flag() -> None:
+    """Re-read sim_logger's level into the cached _DEBUG switch used by the simulation loop."""
+    global _DEBUG
+    _DEBUG = sim_logger.isEnabledFor(logging.DEBUG)
+
+
+def _uniform_draws(rng: np.random.Generator, block_size: int = 4096) -> Iterator[float]:
+    """
+    Endless stream of uniform [0, 1) floats for the Python simulation path.
+
+    Uniforms are generated a block at a time and handed out by built-in iterators, so a draw
+    is a single next() call with no Python-level bookkeeping. The stream is module-global and
+    not safe to share between threads; a seeded run is only reproducible from a single thread.
+    """
+    return chain.from_iterable(map(methodcaller('tolist'), map(rng.random, repeat(block_size))))
+
+
+_rng = np.random.default_rng()
+_draws = _uniform_draws(_rng)
+
+
+def seed_reference_rng(seed: Optional[int]) -> None:
+    """
+    Seed the generator used by simulate_point and by simulate_many when no seed is given.
+
+    Args:
+        seed (Optional[int]): Seed for the PCG64 generator, or None for fresh OS entropy.
+    """
+    global _rng, _draws
+    _rng = np.random.default_rng(seed)
+    _draws = _uniform_draws(_rng)
+
+
+# Point outcomes from _simulate_point as (winner, is_ace, is_double_fault), shared to avoid a tuple per point
+_POINT_ACE = ('server', 1, 0)
+_POINT_SERVER = ('server', 0, 0)
+_POINT_RETURNER = ('returner', 0, 0)
+_POINT_DOUBLE_FAULT = ('returner', 0, 1)
+
+
+def _simulate_point(server: PlayerStats, returner: PlayerStats) -> Tuple[str, int, int]:
+    """
+    Play one point and report how it ended, for the game and tie-break loops.
 
     Args:
         server (PlayerStats): Statistics for the serving player.
         returner (PlayerStats): Statistics for the receiving player.
-        is_break_point (bool): Indicates if the current point is a break point.
 
     Returns:
-        str: 'server' or 'returner' indicating the point winner.
+        Tuple[str, int, int]: 'server' or 'returner', then 1 if the point was an ace and 1 if it
+            was a double fault (0 otherwise).
     """
     # Determine if it's a first or second serve
-    first_serve_in = np.random.rand() < server.FirstServePercentage
+    first_serve_in = next(_draws) < server.FirstServePercentage
 
     if first_serve_in:
         # Check for ace
-        is_ace = np.random.rand() < server.AcePercentage
+        is_ace = next(_draws) < server.AcePercentage
         if is_ace:
-            sim_logger.debug(f"{server.Player} serves an ACE!")
-            return 'server'
+            if _DEBUG:
+                sim_logger.debug("%s serves an ACE!", server.Player)
+            return _POINT_ACE
 
         # Determine if server wins the point on first serve
-        point_won = np.random.rand() < server.FirstServeWonPercentage
+        point_won = next(_draws) < server.FirstServeWonPercentage
         if point_won:
-            sim_logger.debug(f"{server.Player} wins the point on first serve.")
-            return 'server'
+            if _DEBUG:
+                sim_logger.debug("%s wins the point on first serve.", server.Player)
+            return _POINT_SERVER
         else:
-            sim_logger.debug(f"{returner.Player} wins the point on {server.Player}'s first serve.")
-            return 'returner'
+            if _DEBUG:
+                sim_logger.debug("%s wins the point on %s's first serve.", returner.Player, server.Player)
+            return _POINT_RETURNER
     else:
         # Second serve
         # Determine if it's a double fault
-        double_fault = np.random.rand() < server.DoubleFaultPercentage
+        double_fault = next(_draws) < server.DoubleFaultPercentage
         if double_fault:
-            sim_logger.debug(f"{server.Player} commits a DOUBLE FAULT!")
-            return 'returner'
+            if _DEBUG:
+                sim_logger.debug("%s commits a DOUBLE FAULT!", server.Player)
+            return _POINT_DOUBLE_FAULT
 
         # Determine if server wins the point on second serve
-        point_won = np.random.rand() < server.SecondServeWonPercentage
+        point_won = next(_draws) < server.SecondServeWonPercentage
         if point_won:
-            sim_logger.debug(f"{server.Player} wins the point on second serve.")
-            return 'server'
+            if _DEBUG:
+                sim_logger.debug("%s wins the point on second serve.", server.Player)
+            return _POINT_SERVER
         else:
-            sim_logger.debug(f"{returner.Player} wins the point on {server.Player}'s second serve.")
-            return 'returner'
+            if _DEBUG:
+                sim_logger.debug("%s wins the point on %s's second serve.", returner.Player, server.Player)
+            return _POINT_RETURNER
+
+
+def simulate_point(server: PlayerStats, returner: PlayerStats) -> str:
+    """
+    Simulates a single point between server and returner.
+
+    Args:
+        server (PlayerStats): Statistics for the serving player.
+        returner (PlayerStats): Statistics for the receiving player.
+
+    Returns:
+        str: 'server' or 'returner' indicating the point winner.
+    """
+    return _simulate_point(server, returner)[0]
 
 
-def simulate_game(server: PlayerStats, returner: PlayerStats) -> Dict[str, Any]:
+def simulate_game(server: PlayerStats, returner: PlayerStats) -> GameResult:
     """
     Simulates a single tennis game between server and returner with detailed logs.
 
@@ -72,79 +236,68 @@ def simulate_game(server: PlayerStats, returner: PlayerStats) -> Dict[str, Any]:
         returner (PlayerStats): Statistics for the receiving player.
 
     Returns:
-        Dict[str, Any]: Dictionary containing 'winner', 'aces', 'double_faults', 'break_point_converted'.
+        GameResult: Game winner's name, 'aces', 'double_faults' and 'break_point_converted'.
     """
-    score_map = {0: '0', 1: '15', 2: '30', 3: '40'}
     server_points = 0
     returner_points = 0
     point_number = 1
-    advantage = None
 
     game_aces = 0
     game_double_faults = 0
-    break_point_converted = False
 
-    sim_logger.debug(f"Starting game: Server ({server.Player}) vs Returner ({returner.Player})\n")
+    if _DEBUG:
+        sim_logger.debug("Starting game: Server (%s) vs Returner (%s)\n", server.Player, returner.Player)
 
     while True:
-        sim_logger.debug(f"--- Point {point_number} ---")
+        if _DEBUG:
+            sim_logger.debug("--- Point %s ---", point_number)
+            sim_logger.debug(
+                "Current Points -> Server: %s, Returner: %s",
+                _SCORE_MAP[server_points] if server_points < 4 else '40+',
+                _SCORE_MAP[returner_points] if returner_points < 4 else '40+'
+            )
         point_number += 1
 
-        current_server_score = score_map.get(server_points, '40+')
-        current_returner_score = score_map.get(returner_points, '40+')
-        sim_logger.debug(f"Current Points -> Server: {current_server_score}, Returner: {current_returner_score}")
-
-        # Determine if current point is a break point
-        is_break_point = False
-        if server_points >= 3 and returner_points >= 3:
-            if server_points == 3 and returner_points == 3:
-                is_break_point = False
-            elif server_points == 4 and returner_points == 3:
-                is_break_point = False
-            elif server_points == 3 and returner_points == 4:
-                is_break_point = True
-
         # Simulate the point
-        point_winner = simulate_point(server, returner, is_break_point)
+        point_winner, is_ace, is_double_fault = _simulate_point(server, returner)
+        game_aces += is_ace
+        game_double_faults += is_double_fault
 
         # Update points based on who won the point
         if point_winner == 'server':
             server_points += 1
-            sim_logger.debug(f"{server.Player} wins the point. Score: Server {score_map.get(server_points, '40+')}, Returner {score_map.get(returner_points, '0')}\n")
-            # Check if this point was an ace
-            # (Already logged in simulate_point)
+            if _DEBUG:
+                sim_logger.debug(
+                    "%s wins the point. Score: Server %s, Returner %s\n",
+                    server.Player, _SCORE_MAP[server_points] if server_points < 4 else '40+',
+                    _SCORE_MAP[returner_points] if returner_points < 4 else '40+'
+                )
         else:
             returner_points += 1
-            sim_logger.debug(f"{returner.Player} wins the point. Score: Server {score_map.get(server_points, '0')}, Returner {score_map.get(returner_points, '40+')}\n")
+            if _DEBUG:
+                sim_logger.debug(
+                    "%s wins the point. Score: Server %s, Returner %s\n",
+                    returner.Player, _SCORE_MAP[server_points] if server_points < 4 else '40+',
+                    _SCORE_MAP[returner_points] if returner_points < 4 else '40+'
+                )
 
         # Check for game win conditions
         if server_points >= 4 and server_points - returner_points >= 2:
-            sim_logger.debug(f"{server.Player} wins the game!\n")
-            return {
-                'winner': server.Player,
-                'aces': game_aces,
-                'double_faults': game_double_faults,
-                'break_point_converted': break_point_converted
-            }
+            if _DEBUG:
+                sim_logger.debug("%s wins the game!\n", server.Player)
+            return GameResult(server.Player, game_aces, game_double_faults, False)
         elif returner_points >= 4 and returner_points - server_points >= 2:
-            sim_logger.debug(f"{returner.Player} wins the game!\n")
-            return {
-                'winner': returner.Player,
-                'aces': game_aces,
-                'double_faults': game_double_faults,
-                'break_point_converted': break_point_converted
-            }
+            # A service game is only ever lost on a break point, so this converts one
+            if _DEBUG:
+                sim_logger.debug("%s converts a break point and wins the game!\n", returner.Player)
+            return GameResult(returner.Player, game_aces, game_double_faults, True)
 
-        # Additional logic for break point conversions
-        if is_break_point:
-            if point_winner == 'returner':
-                break_point_converted = True
-                sim_logger.debug(f"{returner.Player} converts a break point!\n")
-            elif point_winner == 'server':
-                sim_logger.debug(f"{server.Player} saves a break point!\n")
+        # The game is still going, so a server point won while trailing at 40 saved a break point
+        if _DEBUG and point_winner == 'server' and returner_points >= 3 and returner_points >= server_points:
+            sim_logger.debug("%s saves a break point!\n", server.Player)
 
 
-def simulate_set(server_id: int, player1: PlayerStats, player2: PlayerStats) -> Dict[str, Any]:
+def simulate_set(server_id: int, player1: PlayerStats, player2: PlayerStats) -> SetResult:
     """
     Simulate a single set between two players, tracking game outcomes and counts.
 
@@ -154,96 +307,82 @@ def simulate_set(server_id: int, player1: PlayerStats, player2: PlayerStats) ->
         player2 (PlayerStats): Statistics for Player 2.
 
     Returns:
-        Dict[str, Any]: Dictionary containing set winner, game outcomes, 'aces', 'double_faults', and breaks.
+        SetResult: Set winner, game outcomes, and each player's aces, double faults, breaks and games.
     """
-    player1_games = 0
-    player2_games = 0
     games = []
-    clean_set = True  # Assume clean set until a game is lost
-    set_aces = 0
-    set_double_faults = 0
-    set_break_point_converted = 0
-    player1_breaks = 0
-    player2_breaks = 0
+    # Per-player tallies indexed 0 (player1) and 1 (player2): aces and double faults belong to
+    # whoever served the game, breaks to whoever won the other player's service game
+    games_won = [0, 0]
+    aces = [0, 0]
+    double_faults = [0, 0]
+    breaks = [0, 0]
 
-    while True:
-        if server_id == 1:
-            server = player1
-            returner = player2
-            serving_player = 'player1'
-            receiving_player = 'player2'
-        else:
-            server = player2
-            returner = player1
-            serving_player = 'player2'
-            receiving_player = 'player1'
+    players = (player1, player2)
+    first_server_index = server_id - 1  # 0 for Player 1, 1 for Player 2; also opens the tie-break
+    server_index = first_server_index
 
-        game_result = simulate_game(server, returner)
-        winner = game_result['winner']
-        aces = game_result['aces']
-        double_faults = game_result['double_faults']
-        break_point_converted = game_result['break_point_converted']
+    while True:
+        returner_index = server_index ^ 1
+        server = players[server_index]
 
-        set_aces += aces
-        set_double_faults += double_faults
-        set_break_point_converted += int(break_point_converted)
+        winner, game_aces, game_double_faults, break_point_converted = simulate_game(server, players[returner_index])
 
+        aces[server_index] += game_aces
+        double_faults[server_index] += game_double_faults
         games.append(winner)
 
-        # Update game counts
-        if winner == player1.Player:
-            player1_games += 1
-            if serving_player != 'player1':
-                player1_breaks += 1  # Player1 broke Player2's serve
+        # Update game counts; the returner only wins a game by converting a break point
+        if break_point_converted:
+            games_won[returner_index] += 1
+            breaks[returner_index] += 1
         else:
-            player2_games += 1
-            if serving_player != 'player2':
-                player2_breaks += 1  # Player2 broke Player1's serve
-            clean_set = False  # Player lost a game in this set
+            games_won[server_index] += 1
+        player1_games, player2_games = games_won
 
-        sim_logger.debug(f"Game {len(games)}: {serving_player} serves. Winner: {winner}. {'Break!' if (winner != serving_player) else 'No Break.'}")
+        if _DEBUG:
+            sim_logger.debug(
+                "Game %s: %s serves. Winner: %s. %s", len(games), _PLAYER_KEYS[server_index], winner,
+                'Break!' if break_point_converted else 'No Break.'
+            )
 
         # Check for set win
         if (player1_games >= 6 or player2_games >= 6) and abs(player1_games - player2_games) >= 2:
             set_winner = 'player1' if player1_games > player2_games else 'player2'
-            sim_logger.debug(f"Set Winner: {set_winner}, Games: {player1_games}-{player2_games}")
-            return {
-                'set_winner': set_winner,
-                'games': games,
-                'CleanSet': clean_set,
-                'aces': set_aces,
-                'double_faults': set_double_faults,
-                'break_points_converted': set_break_point_converted,
-                'player1_breaks': player1_breaks,
-                'player2_breaks': player2_breaks
-            }
+            if _DEBUG:
+                sim_logger.debug("Set Winner: %s, Games: %s-%s", set_winner, player1_games, player2_games)
+            # Clean set: the winner didn't drop a game
+            return SetResult(
+                set_winner, games, player1_games == 0 or player2_games == 0, aces[0], aces[1],
+                double_faults[0], double_faults[1], breaks[0], breaks[1], player1_games, player2_games
+            )
 
         # Tie-break condition
         if player1_games == 6 and player2_games == 6:
-            tie_break_winner = simulate_tie_break(server_id, player1, player2)
+            (tie_break_winner, player1_aces, player2_aces,
+             player1_double_faults, player2_double_faults) = simulate_tie_break(first_server_index + 1, player1, player2)
+            aces[0] += player1_aces
+            aces[1] += player2_aces
+            double_faults[0] += player1_double_faults
+            double_faults[1] += player2_double_faults
             if tie_break_winner == 'player1':
                 player1_games += 1
             else:
                 player2_games += 1
             games.append(tie_break_winner)
             set_winner = 'player1' if player1_games > player2_games else 'player2'
-            sim_logger.debug(f"Tie-Break Winner: {set_winner}, Games: {player1_games}-{player2_games}")
-            return {
-                'set_winner': set_winner,
-                'games': games,
-                'CleanSet': False,  # Tie-break implies the set wasn't clean
-                'aces': set_aces,
-                'double_faults': set_double_faults,
-                'break_points_converted': set_break_point_converted,
-                'player1_breaks': player1_breaks,
-                'player2_breaks': player2_breaks
-            }
+            if _DEBUG:
+                sim_logger.debug("Tie-Break Winner: %s, Games: %s-%s", set_winner, player1_games, player2_games)
+            # Tie-break implies the set wasn't clean
+            return SetResult(
+                set_winner, games, False, aces[0], aces[1],
+                double_faults[0], double_faults[1], breaks[0], breaks[1], player1_games, player2_games
+            )
 
         # Alternate server
-        server_id = 2 if server_id == 1 else 1
+        server_index = returner_index
 
 
-def simulate_tie_break(server_id: int, player1: PlayerStats, player2: PlayerStats) -> str:
+def simulate_tie_break(server_id: int, player1: PlayerStats, player2: PlayerStats) -> TieBreakResult:
     """
     Simulate a tie-break game in a tennis match.
 
@@ -253,59 +392,87 @@ def simulate_tie_break(server_id: int, player1: PlayerStats, player2: PlayerStat
         player2 (PlayerStats): Statistics for Player 2.
 
     Returns:
-        str: 'player1' or 'player2' indicating the tie-break winner.
+        TieBreakResult: Tie-break winner ('player1' or 'player2') and each player's aces and double faults.
     """
-    player1_points = 0
-    player2_points = 0
+    points = [0, 0]
+    aces = [0, 0]
+    double_faults = [0, 0]
     points_played = 0
+    players = (player1, player2)
+    first_server_index = server_id - 1  # 0 for Player 1, 1 for Player 2
 
-    sim_logger.debug("Starting Tie-Break...")
+    if _DEBUG:
+        sim_logger.debug("Starting Tie-Break...")
 
     while True:
+        # First server serves one point, then players alternate every two points
+        server_index = first_server_index ^ _TIE_BREAK_ROTATION[points_played & 3]
         points_played += 1
-        # Determine current server based on tie-break rules
-        if points_played == 1:
-            current_server_id = server_id
-        else:
-            # After the first point, players alternate every two points
-            current_server_id = 2 if ((points_played - 1) // 2) % 2 == 1 else 1
-
-        # Assign server and returner based on current_server_id
-        if current_server_id == 1:
-            server = player1
-            returner = player2
-            server_player = 'player1'
-        else:
-            server = player2
-            returner = player1
-            server_player = 'player2'
-
-        # Simulate the point
-        point_winner = simulate_point(server, returner)
-
-        # Determine who won the point
-        if point_winner == 'server':
-            game_winner = server_player
-        else:
-            game_winner = 'player1' if server_player == 'player2' else 'player2'
 
-        if game_winner == 'player1':
-            player1_points += 1
-        else:
-            player2_points += 1
-
-        sim_logger.debug(
-            f"Tie-Break Point: {game_winner}, Current Score: Player1={player1_points}, Player2={player2_points}"
-        )
+        # Simulate the point, one serve at a time rather than through simulate_game
+        point_winner, is_ace, is_double_fault = _simulate_point(players[server_index], players[server_index ^ 1])
+        aces[server_index] += is_ace
+        double_faults[server_index] += is_double_fault
+        points[server_index if point_winner == 'server' else server_index ^ 1] += 1
+        player1_points, player2_points = points
+
+        if _DEBUG:
+            sim_logger.debug(
+                "Tie-Break Point: %s, Current Score: Player1=%s, Player2=%s",
+                _PLAYER_KEYS[server_index if point_winner == 'server' else server_index ^ 1],
+                player1_points, player2_points
+            )
 
         # Check for tie-break win condition
         if (player1_points >= 7 or player2_points >= 7) and abs(player1_points - player2_points) >= 2:
             tie_break_winner = 'player1' if player1_points > player2_points else 'player2'
-            sim_logger.debug(f"Tie-Break Winner: {tie_break_winner}")
-            return tie_break_winner
+            if _DEBUG:
+                sim_logger.debug("Tie-Break Winner: %s", tie_break_winner)
+            return TieBreakResult(tie_break_winner, aces[0], aces[1], double_faults[0], double_faults[1])
 
 
-def simulate_match(player1: PlayerStats, player2: PlayerStats, best_of: int = 3) -> Dict[str, Any]:
+def _fantasy_stats(counter: Callable[[int], Any], match_played: Any, advanced_by_walkover: Any) -> Dict[str, Any]:
+    """
+    The one derivation of fantasy stats and bonuses from COUNTERS values, shared by the per-match
+    payload and counts_to_fantasy_stats.
+
+    counter(index) returns one COUNTERS column: an int for a single match or an array for a batch.
+    The no-double-fault and ace bonuses follow from the totals, and the clean set and straight sets
+    flags from their counters.
+    """
+    aces = counter(_ACES)
+    double_faults = counter(_DOUBLE_FAULTS)
+    return {
+        'MatchPlayed': match_played,
+        'AdvancedByWalkover': advanced_by_walkover,
+        'Aces': aces,
+        'DoubleFaults': double_faults,
+        'GamesWon': counter(_GAMES_WON),
+        'GamesLost': counter(_GAMES_LOST),
+        'SetsWon': counter(_SETS_WON),
+        'SetsLost': counter(_SETS_LOST),
+        'CleanSet': counter(_CLEAN_SET) != 0,
+        'StraightSets': counter(_STRAIGHT_SETS) != 0,
+        'NoDoubleFault': double_faults == 0,
+        'TenPlusAces': aces >= 10,
+        'FifteenPlusAces': aces >= 15,
+        'Breaks': counter(_BREAKS)
+    }
+
+
+def _fantasy_stats_from_counts(player_counts: List[int]) -> Dict[str, Any]:
+    """
+    Build one player's fantasy stats payload from their COUNTERS-ordered match counts.
+
+    Every break of serve is a converted break point.
+    """
+    stats = _fantasy_stats(player_counts.__getitem__, True, False)
+    stats['BreakPointsConverted'] = stats['Breaks']
+    return stats
+
+
+def simulate_match(player1: PlayerStats, player2: PlayerStats, best_of: int = 3,
+                   counts: Optional[np.ndarray] = None) -> Dict[str, Any]:
     """
     Simulate a full tennis match between two players with comprehensive use of rate stats.
 
@@ -313,9 +480,12 @@ def simulate_match(player1: PlayerStats, player2: PlayerStats, best_of: int = 3)
         player1 (PlayerStats): Statistics for Player 1.
         player2 (PlayerStats): Statistics for Player 2.
         best_of (int, optional): Number of sets to play. Defaults to 3.
+        counts (Optional[np.ndarray], optional): Int array of shape (2, N_COUNTERS), typically one
+            row of a preallocated batch buffer, that receives the COUNTERS for each player.
 
     Returns:
-        Dict[str, Any]: Dictionary containing match winner, detailed set results, and fantasy points.
+        Dict[str, Any]: Dictionary containing match winner, detailed set results, and the
+            fantasy stat counters ('player1_stats', 'player2_stats') for each player.
     """
     # Reset match-specific statistics before starting the match
     player1.reset_match_stats()
@@ -327,103 +497,48 @@ def simulate_match(player1: PlayerStats, player2: PlayerStats, best_of: int = 3)
     server_id = 1  # Assuming Player 1 serves first
     sets = []  # To store set-by-set outcomes
 
-    # Initialize count-based statistics
-    player1_fantasy_counts = {
-        'Aces': 0,
-        'DoubleFaults': 0,
-        'GamesWon': 0,
-        'GamesLost': 0,
-        'SetsWon': 0,
-        'SetsLost': 0,
-        'Breaks': 0,
-        'BreakPointsConverted': 0,
-        'CleanSet': False,
-        'StraightSets': False,
-        'NoDoubleFault': True,
-        'TenPlusAces': False,
-        'FifteenPlusAces': False
-    }
-
-    player2_fantasy_counts = {
-        'Aces': 0,
-        'DoubleFaults': 0,
-        'GamesWon': 0,
-        'GamesLost': 0,
-        'SetsWon': 0,
-        'SetsLost': 0,
-        'Breaks': 0,
-        'BreakPointsConverted': 0,
-        'CleanSet': False,
-        'StraightSets': False,
-        'NoDoubleFault': True,
-        'TenPlusAces': False,
-        'FifteenPlusAces': False
-    }
+    # Count-based statistics in COUNTERS order, the same layout the compiled kernel fills
+    player1_counts = [0] * N_COUNTERS
+    player2_counts = [0] * N_COUNTERS
+    match_counts = (player1_counts, player2_counts)
+    required_sets = (best_of // 2) + 1
 
     match_start_time = time.time()
 
     while True:
-        set_result = simulate_set(server_id, player1, player2)
-        set_winner = set_result['set_winner']
-        games = set_result['games']
-        clean_set = set_result['CleanSet']
-        set_aces = set_result['aces']
-        set_double_faults = set_result['double_faults']
-        set_break_point_converted = set_result['break_points_converted']
-        player1_breaks = set_result.get('player1_breaks', 0)
-        player2_breaks = set_result.get('player2_breaks', 0)
+        (set_winner, games, clean_set, player1_aces, player2_aces, player1_double_faults, player2_double_faults,
+         player1_breaks, player2_breaks, player1_games, player2_games) = simulate_set(server_id, player1, player2)
 
         # Update set counts
         if set_winner == 'player1':
             player1_sets += 1
-            player1_fantasy_counts['SetsWon'] += 1
-            player2_fantasy_counts['SetsLost'] += 1
+            winner_index = 0
         else:
             player2_sets += 1
-            player2_fantasy_counts['SetsWon'] += 1
-            player1_fantasy_counts['SetsLost'] += 1
+            winner_index = 1
+        winner_counts = match_counts[winner_index]
+        winner_counts[_SETS_WON] += 1
+        match_counts[winner_index ^ 1][_SETS_LOST] += 1
 
         # Update game counts
-        player1_fantasy_counts['GamesWon'] += games.count(player1.Player)
-        player1_fantasy_counts['GamesLost'] += games.count(player2.Player)
-        player2_fantasy_counts['GamesWon'] += games.count(player2.Player)
-        player2_fantasy_counts['GamesLost'] += games.count(player1.Player)
+        player1_counts[_GAMES_WON] += player1_games
+        player1_counts[_GAMES_LOST] += player2_games
+        player2_counts[_GAMES_WON] += player2_games
+        player2_counts[_GAMES_LOST] += player1_games
 
         # Update break points
-        player1_fantasy_counts['Breaks'] += player1_breaks
-        player2_fantasy_counts['Breaks'] += player2_breaks
+        player1_counts[_BREAKS] += player1_breaks
+        player2_counts[_BREAKS] += player2_breaks
 
-        # Update Aces and Double Faults
-        if set_winner == 'player1':
-            player1_fantasy_counts['Aces'] += set_aces
-            player1_fantasy_counts['DoubleFaults'] += set_double_faults
-            player1_fantasy_counts['BreakPointsConverted'] += set_break_point_converted
-            if set_double_faults > 0:
-                player1_fantasy_counts['NoDoubleFault'] = False
-        else:
-            player2_fantasy_counts['Aces'] += set_aces
-            player2_fantasy_counts['DoubleFaults'] += set_double_faults
-            player2_fantasy_counts['BreakPointsConverted'] += set_break_point_converted
-            if set_double_faults > 0:
-                player2_fantasy_counts['NoDoubleFault'] = False
-
-        # Update TenPlusAces and FifteenPlusAces Bonuses
-        if player1_fantasy_counts['Aces'] >= 15:
-            player1_fantasy_counts['FifteenPlusAces'] = True
-        elif player1_fantasy_counts['Aces'] >= 10:
-            player1_fantasy_counts['TenPlusAces'] = True
-
-        if player2_fantasy_counts['Aces'] >= 15:
-            player2_fantasy_counts['FifteenPlusAces'] = True
-        elif player2_fantasy_counts['Aces'] >= 10:
-            player2_fantasy_counts['TenPlusAces'] = True
+        # Update Aces and Double Faults, already attributed to the player serving them
+        player1_counts[_ACES] += player1_aces
+        player2_counts[_ACES] += player2_aces
+        player1_counts[_DOUBLE_FAULTS] += player1_double_faults
+        player2_counts[_DOUBLE_FAULTS] += player2_double_faults
 
         # Update Clean Set Bonus
         if clean_set:
-            if set_winner == 'player1':
-                player1_fantasy_counts['CleanSet'] = True
-            else:
-                player2_fantasy_counts['CleanSet'] = True
+            winner_counts[_CLEAN_SET] = 1
 
         sets.append({
             'set_number': set_num,
@@ -432,83 +547,31 @@ def simulate_match(player1: PlayerStats, player2: PlayerStats, best_of: int = 3)
             'CleanSet': clean_set
         })
 
-        sim_logger.debug(f"Set {set_num} Winner: {set_winner}, Score: Player1={player1_sets}-Player2={player2_sets}")
+        if _DEBUG:
+            sim_logger.debug(
+                "Set %s Winner: %s, Score: Player1=%s-Player2=%s", set_num, set_winner, player1_sets, player2_sets
+            )
 
         # Check for match winner
-        required_sets = (best_of // 2) + 1
         if player1_sets == required_sets or player2_sets == required_sets:
             match_winner = 'player1' if player1_sets > player2_sets else 'player2'
             match_duration = time.time() - match_start_time
 
+            winner_counts[_MATCH_WON] = 1
             # Determine Straight Sets Bonus
-            straight_sets = (player1_sets == required_sets and player2_sets == 0) or \
-                            (player2_sets == required_sets and player1_sets == 0)
-            if straight_sets:
-                if match_winner == 'player1':
-                    player1_fantasy_counts['StraightSets'] = True
-                else:
-                    player2_fantasy_counts['StraightSets'] = True
-
-            # Prepare stats for fantasy points calculation for both players
-            fantasy_stats_player1 = {
-                'MatchPlayed': True,
-                'AdvancedByWalkover': False,
-                'Aces': player1_fantasy_counts['Aces'],
-                'DoubleFaults': player1_fantasy_counts['DoubleFaults'],
-                'GamesWon': player1_fantasy_counts['GamesWon'],
-                'GamesLost': player1_fantasy_counts['GamesLost'],
-                'SetsWon': player1_fantasy_counts['SetsWon'],
-                'SetsLost': player1_fantasy_counts['SetsLost'],
-                'CleanSet': player1_fantasy_counts['CleanSet'],
-                'StraightSets': player1_fantasy_counts['StraightSets'],
-                'NoDoubleFault': player1_fantasy_counts['NoDoubleFault'],
-                'TenPlusAces': player1_fantasy_counts['TenPlusAces'],
-                'FifteenPlusAces': player1_fantasy_counts['FifteenPlusAces'],
-                'Breaks': player1_fantasy_counts['Breaks'],
-                'BreakPointsConverted': player1_fantasy_counts['BreakPointsConverted']
-            }
+            if player1_sets == 0 or player2_sets == 0:
+                winner_counts[_STRAIGHT_SETS] = 1
 
-            fantasy_stats_player2 = {
-                'MatchPlayed': True,
-                'AdvancedByWalkover': False,
-                'Aces': player2_fantasy_counts['Aces'],
-                'DoubleFaults': player2_fantasy_counts['DoubleFaults'],
-                'GamesWon': player2_fantasy_counts['GamesWon'],
-                'GamesLost': player2_fantasy_counts['GamesLost'],
-                'SetsWon': player2_fantasy_counts['SetsWon'],
-                'SetsLost': player2_fantasy_counts['SetsLost'],
-                'CleanSet': player2_fantasy_counts['CleanSet'],
-                'StraightSets': player2_fantasy_counts['StraightSets'],
-                'NoDoubleFault': player2_fantasy_counts['NoDoubleFault'],
-                'TenPlusAces': player2_fantasy_counts['TenPlusAces'],
-                'FifteenPlusAces': player2_fantasy_counts['FifteenPlusAces'],
-                'Breaks': player2_fantasy_counts['Breaks'],
-                'BreakPointsConverted': player2_fantasy_counts['BreakPointsConverted']
-            }
+            if counts is not None:
+                counts[:] = match_counts
 
-            # Calculate Fantasy Points
-            player1_fantasy_points = calculate_fantasy_points(
-                stats=fantasy_stats_player1,
-                match_won=(match_winner == 'player1'),
-                best_of=best_of
-            )
-
-            player2_fantasy_points = calculate_fantasy_points(
-                stats=fantasy_stats_player2,
-                match_won=(match_winner == 'player2'),
-                best_of=best_of
-            )
-
-            # Log Fantasy Points Breakdown
-            sim_logger.debug(f"{player1.Player} Fantasy Points: {player1_fantasy_points}")
-            sim_logger.debug(f"{player2.Player} Fantasy Points: {player2_fantasy_points}")
-
-            # Return match results with separate fantasy points
+            # Return match results with the primitive counters; fantasy points are
+            # scored in bulk by score_counts over a batch of matches
             return {
                 'winner': match_winner,
                 'sets': sets,
-                'player1_fantasy_points': player1_fantasy_points,
-                'player2_fantasy_points': player2_fantasy_points,
+                'player1_stats': _fantasy_stats_from_counts(player1_counts),
+                'player2_stats': _fantasy_stats_from_counts(player2_counts),
                 'duration': match_duration
             }
 
@@ -516,323 +579,544 @@ def simulate_match(player1: PlayerStats, player2: PlayerStats, best_of: int = 3)
         server_id = 2 if server_id == 1 else 1
 
 
-def simulate_tie_break(server_id: int, player1: PlayerStats, player2: PlayerStats) -> str:
+def simulate_matches_reference(n_sims: int, player1: PlayerStats, player2: PlayerStats,
+                               best_of: int = 3) -> np.ndarray:
     """
-    Simulate a tie-break game in a tennis match.
+    Simulate n_sims matches with the Python reference path into one preallocated counts array.
 
     Args:
-        server_id (int): ID of the serving player (1 or 2).
+        n_sims (int): Number of matches to simulate.
         player1 (PlayerStats): Statistics for Player 1.
         player2 (PlayerStats): Statistics for Player 2.
+        best_of (int, optional): Number of sets to play. Defaults to 3.
 
     Returns:
-        str: 'player1' or 'player2' indicating the tie-break winner.
+        np.ndarray: Int array of shape (n_sims, 2, N_COUNTERS) in the layout of the compiled
+            kernel, ready for score_counts.
     """
-    player1_points = 0
-    player2_points = 0
-    points_played = 0
+    counts = np.zeros((n_sims, 2, N_COUNTERS), dtype=np.int32)
+    for sim_index in range(n_sims):
+        simulate_match(player1, player2, best_of, counts[sim_index])
+    return counts
 
-    sim_logger.debug("Starting Tie-Break...")
 
-    while True:
-        points_played += 1
-        # Determine current server based on tie-break rules
-        if points_played == 1:
-            current_server_id = server_id
-        else:
-            # After the first point, players alternate every two points
-            current_server_id = 2 if ((points_played - 1) // 2) % 2 == 1 else 1
-
-        # Assign server and returner based on current_server_id
-        if current_server_id == 1:
-            server = player1
-            returner = player2
-            server_player = 'player1'
-        else:
-            server = player2
-            returner = player1
-            server_player = 'player2'
+def _simulate_reference_chunk(n_sims: int, player1: PlayerStats, player2: PlayerStats, best_of: int,
+                              seed: int) -> np.ndarray:
+    """Worker for simulate_matches: seed this process's reference RNG, then run its chunk."""
+    seed_reference_rng(seed)
+    return simulate_matches_reference(n_sims, player1, player2, best_of)
 
-        # Simulate the point
-        point_winner = simulate_point(server, returner)
 
-        # Determine who won the point
-        if point_winner == 'server':
-            game_winner = server_player
-        else:
-            game_winner = 'player1' if server_player == 'player2' else 'player2'
+def simulate_matches(player1: PlayerStats, player2: PlayerStats, n_sims: int, best_of: int = 3,
+                     n_jobs: Optional[int] = None, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Simulate n_sims matches with the Python reference path, split across worker processes.
 
-        if game_winner == 'player1':
-            player1_points += 1
-        else:
-            player2_points += 1
+    The reference path holds the GIL, so the chunks run in a ProcessPoolExecutor rather than in
+    threads. Prefer simulate_many when Numba is available; it parallelizes within one process.
 
-        sim_logger.debug(
-            f"Tie-Break Point: {game_winner}, Current Score: Player1={player1_points}, Player2={player2_points}"
-        )
+    Args:
+        player1 (PlayerStats): Statistics for Player 1.
+        player2 (PlayerStats): Statistics for Player 2.
+        n_sims (int): Number of matches to simulate.
+        best_of (int, optional): Number of sets to play. Defaults to 3.
+        n_jobs (Optional[int], optional): Number of worker processes. Defaults to the CPU count;
+            1 runs in the calling process.
+        seed (Optional[int], optional): Base seed; worker w seeds its generator with seed + w.
+            Defaults to a random seed.
 
-        # Check for tie-break win condition
-        if (player1_points >= 7 or player2_points >= 7) and abs(player1_points - player2_points) >= 2:
-            tie_break_winner = 'player1' if player1_points > player2_points else 'player2'
-            sim_logger.debug(f"Tie-Break Winner: {tie_break_winner}")
-            return tie_break_winner
+    Returns:
+        np.ndarray: Int array of shape (n_sims, 2, N_COUNTERS), ready for score_counts.
+    """
+    if seed is None:
+        seed = int(_rng.integers(4294967296))
+    n_jobs = max(1, min(n_jobs or os.cpu_count() or 1, n_sims))
+    if n_jobs == 1:
+        return _simulate_reference_chunk(n_sims, player1, player2, best_of, seed)
+
+    # Near-equal chunks, one per worker
+    chunk_sizes = [n_sims // n_jobs + (worker_id < n_sims % n_jobs) for worker_id in range(n_jobs)]
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        chunks = executor.map(
+            _simulate_reference_chunk,
+            chunk_sizes,
+            repeat(player1),
+            repeat(player2),
+            repeat(best_of),
+            [seed + worker_id for worker_id in range(n_jobs)]
+        )
+        return np.concatenate(list(chunks))
 
 
-def simulate_match(player1: PlayerStats, player2: PlayerStats, best_of: int = 3) -> Dict[str, Any]:
+def run_match_simulation(player1_name: str, player2_name: str, surface: str, player_data: 'pd.DataFrame',
+                        best_of: int = 3,
+                        stats_index: Optional[Dict[Tuple[str, str], Optional[int]]] = None,
+                        stats_map: Optional[Dict[Tuple[str, str], Optional[PlayerStats]]] = None,
+                        seed: Optional[int] = None) -> Optional[Dict[str, Any]]:
     """
-    Simulate a full tennis match between two players with comprehensive use of rate stats.
+    Run a single match simulation between two players with comprehensive use of rate stats.
 
     Args:
-        player1 (PlayerStats): Statistics for Player 1.
-        player2 (PlayerStats): Statistics for Player 2.
+        player1_name (str): Name of Player 1.
+        player2_name (str): Name of Player 2.
+        surface (str): Surface type ('Hard', 'Clay', 'Grass', 'All').
+        player_data (pd.DataFrame): DataFrame containing player statistics.
         best_of (int, optional): Number of sets to play. Defaults to 3.
+        stats_index (Optional[Dict[Tuple[str, str], Optional[int]]], optional): Index returned by build_stats_index.
+            Taken from get_stats_index when omitted, which reuses the index of a cached or repeated frame.
+        stats_map (Optional[Dict[Tuple[str, str], Optional[PlayerStats]]], optional): Mapping returned by
+            build_stats_map. When given, both players come straight from it without DataFrame access.
+        seed (Optional[int], optional): Reseeds the reference PCG64 generator before the match, for a
+            reproducible result. Defaults to None, which keeps drawing from the current stream.
 
     Returns:
-        Dict[str, Any]: Dictionary containing match winner, detailed set results, and fantasy points.
+        Optional[Dict[str, Any]]: Dictionary containing match winner, detailed set results, and fantasy stat counters.
     """
-    # Reset match-specific statistics before starting the match
-    player1.reset_match_stats()
-    player2.reset_match_stats()
+    try:
+        # Rows reached through the stats index or map were validated once in load_player_data
+        if stats_map is not None:
+            player1_stats = lookup_player_stats(player1_name, surface, stats_map)
+            player2_stats = lookup_player_stats(player2_name, surface, stats_map)
+        else:
+            if stats_index is None:
+                stats_index = get_stats_index(player_data)
+            player1_stats_row = get_player_stats(player1_name, surface, player_data, stats_index)
+            player2_stats_row = get_player_stats(player2_name, surface, player_data, stats_index)
+            player1_stats = None if player1_stats_row is None else PlayerStats.from_row_unchecked(player1_stats_row)
+            player2_stats = None if player2_stats_row is None else PlayerStats.from_row_unchecked(player2_stats_row)
+
+        if player1_stats is None or player2_stats is None:
+            missing_player = player1_name if player1_stats is None else player2_name
+            sim_logger.error(SIM_LOG_MESSAGES["error_running_match_simulation"].format(
+                error=f"Player data not found for {missing_player}."
+            ))
+            return None
+    except ValueError as ve:
+        sim_logger.error(SIM_LOG_MESSAGES["error_running_match_simulation"].format(error=str(ve)))
+        return None
 
-    player1_sets = 0
-    player2_sets = 0
-    set_num = 1
-    server_id = 1  # Assuming Player 1 serves first
-    sets = []  # To store set-by-set outcomes
+    if _DEBUG:
+        sim_logger.debug(SIM_LOG_MESSAGES["dataclass_initialized"])
 
-    # Initialize count-based statistics
-    player1_fantasy_counts = {
-        'Aces': 0,
-        'DoubleFaults': 0,
-        'GamesWon': 0,
-        'GamesLost': 0,
-        'SetsWon': 0,
-        'SetsLost': 0,
-        'Breaks': 0,
-        'BreakPointsConverted': 0,
-        'CleanSet': False,
-        'StraightSets': False,
-        'NoDoubleFault': True,
-        'TenPlusAces': False,
-        'FifteenPlusAces': False
-    }
+    if seed is not None:
+        seed_reference_rng(seed)
 
-    player2_fantasy_counts = {
-        'Aces': 0,
-        'DoubleFaults': 0,
-        'GamesWon': 0,
-        'GamesLost': 0,
-        'SetsWon': 0,
-        'SetsLost': 0,
-        'Breaks': 0,
-        'BreakPointsConverted': 0,
-        'CleanSet': False,
-        'StraightSets': False,
-        'NoDoubleFault': True,
-        'TenPlusAces': False,
-        'FifteenPlusAces': False
-    }
+    try:
+        match_result = simulate_match(player1_stats, player2_stats, best_of)
+        return match_result
+    except Exception as e:
+        sim_logger.error(SIM_LOG_MESSAGES["error_running_match_simulation"].format(error=str(e)))
+        return None
 
-    match_start_time = time.time()
 
+########## COMPILED MATCH KERNEL ##########
+# The functions below mirror simulate_point/game/set/tie_break/match, but operate on
+# packed float32 serve arrays (SERVE_COLS order) and an int counters array so Numba can
+# compile them in nopython mode. Players are indexed 0 (player1) and 1 (player2).
+# Each server's rates are reduced once per match to a point-win probability and a
+# closed-form game model; service games are sampled whole, tie-breaks one draw per point.
+
+# Layout of the per-server game model built by _game_model
+(_CDF_HOLD_LOVE, _CDF_HOLD_15, _CDF_HOLD_30, _CDF_BREAK_LOVE, _CDF_BREAK_15, _CDF_BREAK_30,
+ _CDF_DEUCE, _DEUCE_DECIDED, _DEUCE_HOLD, _ACE_GIVEN_WON, _DF_GIVEN_LOST, _POINT_WON) = range(12)
+_GAME_MODEL_SIZE = 12
+
+
+@njit(cache=True)
+def _game_model(server_stats):
+    """
+    Closed-form distribution of a service game, computed once per match for each server.
+
+    The five serve rates collapse into a single chance p that the server wins a point. Points
+    are i.i.d., so a game ends 4-0, 4-1 or 4-2 either way, or reaches deuce (3-3) and then lasts
+    a geometric number of two-point rounds. Given how many serve points were won and lost, the
+    aces and double faults are binomial.
+    """
+    first_serve = server_stats[_FIRST_SERVE]
+    ace = server_stats[_ACE]
+    double_fault = server_stats[_DOUBLE_FAULT]
+    p = (first_serve * (ace + (1.0 - ace) * server_stats[_FIRST_SERVE_WON])
+         + (1.0 - first_serve) * (1.0 - double_fault) * server_stats[_SECOND_SERVE_WON])
+    q = 1.0 - p
+
+    model = np.empty(_GAME_MODEL_SIZE, dtype=np.float64)
+    outcomes = (p ** 4, 4 * p ** 4 * q, 10 * p ** 4 * q ** 2,
+                q ** 4, 4 * q ** 4 * p, 10 * q ** 4 * p ** 2,
+                20 * p ** 3 * q ** 3)
+    cumulative = 0.0
+    for k in range(7):
+        cumulative += outcomes[k]
+        model[_CDF_HOLD_LOVE + k] = cumulative
+    model[_DEUCE_DECIDED] = 1.0 - 2.0 * p * q  # Chance a two-point round after deuce ends the game
+    model[_DEUCE_HOLD] = p * p / (p * p + q * q) if p * p + q * q > 0.0 else 0.5
+    model[_ACE_GIVEN_WON] = min(1.0, first_serve * ace / p) if p > 0.0 else 0.0
+    model[_DF_GIVEN_LOST] = min(1.0, (1.0 - first_serve) * double_fault / q) if q > 0.0 else 0.0
+    model[_POINT_WON] = p
+    return model
+
+
+@njit(cache=True)
+def _play_game(server_model, counts, server):
+    """
+    Plays a service game from its closed-form model, crediting aces and double faults to the
+    server. Returns True on a hold.
+    """
+    u = np.random.random()
+    if u < server_model[_CDF_HOLD_30]:
+        held = True
+        returner_points = 0 if u < server_model[_CDF_HOLD_LOVE] else (1 if u < server_model[_CDF_HOLD_15] else 2)
+        server_points = 4
+    elif u < server_model[_CDF_BREAK_30]:
+        held = False
+        server_points = 0 if u < server_model[_CDF_BREAK_LOVE] else (1 if u < server_model[_CDF_BREAK_15] else 2)
+        returner_points = 4
+    else:
+        # Deuce: each extra round either splits the points (back to deuce) or decides the game
+        rounds = np.random.geometric(server_model[_DEUCE_DECIDED]) - 1
+        held = np.random.random() < server_model[_DEUCE_HOLD]
+        server_points = 3 + rounds + (2 if held else 0)
+        returner_points = 3 + rounds + (0 if held else 2)
+
+    counts[server, _ACES] += np.random.binomial(server_points, server_model[_ACE_GIVEN_WON])
+    counts[server, _DOUBLE_FAULTS] += np.random.binomial(returner_points, server_model[_DF_GIVEN_LOST])
+    return held
+
+
+@njit(cache=True)
+def _play_tie_break(game_models, counts, first_server):
+    """
+    Plays a tie-break point by point with one draw per point, then samples each player's aces
+    and double faults from their serve points won and lost. Returns the index of the winner.
+    """
+    points = np.zeros(2, dtype=np.int64)
+    serve_won = np.zeros(2, dtype=np.int64)
+    serve_lost = np.zeros(2, dtype=np.int64)
+    points_played = 0
     while True:
-        set_result = simulate_set(server_id, player1, player2)
-        set_winner = set_result['set_winner']
-        games = set_result['games']
-        clean_set = set_result['CleanSet']
-        set_aces = set_result['aces']
-        set_double_faults = set_result['double_faults']
-        set_break_point_converted = set_result['break_points_converted']
-        player1_breaks = set_result.get('player1_breaks', 0)
-        player2_breaks = set_result.get('player2_breaks', 0)
+        # First server serves one point, then players alternate every two points
+        server = first_server ^ _TIE_BREAK_CYCLE[points_played & 3]
+        points_played += 1
 
-        # Update set counts
-        if set_winner == 'player1':
-            player1_sets += 1
-            player1_fantasy_counts['SetsWon'] += 1
-            player2_fantasy_counts['SetsLost'] += 1
+        if np.random.random() < game_models[server, _POINT_WON]:
+            serve_won[server] += 1
+            points[server] += 1
         else:
-            player2_sets += 1
-            player2_fantasy_counts['SetsWon'] += 1
-            player1_fantasy_counts['SetsLost'] += 1
+            serve_lost[server] += 1
+            points[1 - server] += 1
 
-        # Update game counts
-        player1_fantasy_counts['GamesWon'] += games.count(player1.Player)
-        player1_fantasy_counts['GamesLost'] += games.count(player2.Player)
-        player2_fantasy_counts['GamesWon'] += games.count(player2.Player)
-        player2_fantasy_counts['GamesLost'] += games.count(player1.Player)
+        if (points[0] >= 7 or points[1] >= 7) and abs(points[0] - points[1]) >= 2:
+            break
 
-        # Update break points
-        player1_fantasy_counts['Breaks'] += player1_breaks
-        player2_fantasy_counts['Breaks'] += player2_breaks
+    for player in range(2):
+        counts[player, _ACES] += np.random.binomial(serve_won[player], game_models[player, _ACE_GIVEN_WON])
+        counts[player, _DOUBLE_FAULTS] += np.random.binomial(serve_lost[player], game_models[player, _DF_GIVEN_LOST])
+    return 0 if points[0] > points[1] else 1
 
-        # Update Aces and Double Faults
-        if set_winner == 'player1':
-            player1_fantasy_counts['Aces'] += set_aces
-            player1_fantasy_counts['DoubleFaults'] += set_double_faults
-            player1_fantasy_counts['BreakPointsConverted'] += set_break_point_converted
-            if set_double_faults > 0:
-                player1_fantasy_counts['NoDoubleFault'] = False
+
+@njit(cache=True)
+def _play_set(game_models, counts, first_server):
+    """Plays a set, updating game, set, break and clean set counters. Returns the set winner."""
+    games = np.zeros(2, dtype=np.int64)
+    server = first_server
+    while True:
+        returner = 1 - server
+        if _play_game(game_models[server], counts, server):
+            games[server] += 1
         else:
-            player2_fantasy_counts['Aces'] += set_aces
-            player2_fantasy_counts['DoubleFaults'] += set_double_faults
-            player2_fantasy_counts['BreakPointsConverted'] += set_break_point_converted
-            if set_double_faults > 0:
-                player2_fantasy_counts['NoDoubleFault'] = False
-
-        # Update TenPlusAces and FifteenPlusAces Bonuses
-        if player1_fantasy_counts['Aces'] >= 15:
-            player1_fantasy_counts['FifteenPlusAces'] = True
-        elif player1_fantasy_counts['Aces'] >= 10:
-            player1_fantasy_counts['TenPlusAces'] = True
-
-        if player2_fantasy_counts['Aces'] >= 15:
-            player2_fantasy_counts['FifteenPlusAces'] = True
-        elif player2_fantasy_counts['Aces'] >= 10:
-            player2_fantasy_counts['TenPlusAces'] = True
+            games[returner] += 1
+            counts[returner, _BREAKS] += 1
+
+        if (games[0] >= 6 or games[1] >= 6) and abs(games[0] - games[1]) >= 2:
+            break
+        if games[0] == 6 and games[1] == 6:
+            games[_play_tie_break(game_models, counts, first_server)] += 1
+            break
+        server = returner
+
+    winner = 0 if games[0] > games[1] else 1
+    loser = 1 - winner
+    for player in range(2):
+        counts[player, _GAMES_WON] += games[player]
+        counts[player, _GAMES_LOST] += games[1 - player]
+    counts[winner, _SETS_WON] += 1
+    counts[loser, _SETS_LOST] += 1
+    if games[loser] == 0:
+        counts[winner, _CLEAN_SET] = 1
+    return winner
+
+
+@njit(cache=True)
+def _simulate_match(player1_stats, player2_stats, best_of):
+    """Plays a full match and returns an int32 array of shape (2, N_COUNTERS)."""
+    counts = np.zeros((2, N_COUNTERS), dtype=np.int32)
+    game_models = np.empty((2, _GAME_MODEL_SIZE), dtype=np.float64)
+    game_models[0] = _game_model(player1_stats)
+    game_models[1] = _game_model(player2_stats)
+    required_sets = (best_of // 2) + 1
+    first_server = 0  # Player 1 serves first
+    while counts[0, _SETS_WON] < required_sets and counts[1, _SETS_WON] < required_sets:
+        _play_set(game_models, counts, first_server)
+        first_server = 1 - first_server
+
+    winner = 0 if counts[0, _SETS_WON] == required_sets else 1
+    counts[winner, _MATCH_WON] = 1
+    if counts[1 - winner, _SETS_WON] == 0:
+        counts[winner, _STRAIGHT_SETS] = 1
+    return counts
+
+
+# Matches played per RNG seed in _simulate_many. Reseeding Numba's Mersenne Twister costs about
+# as much as a fifth of a match, so streams are seeded per block; blocks stay small enough to
+# spread a 100-match batch over several threads.
+SEED_BLOCK = 16
+
+
+@njit(parallel=True, cache=True)
+def _simulate_many(n, player1_stats, player2_stats, best_of, base_seed):
+    """Plays n independent matches across all cores and returns an int32 array of shape (n, 2, N_COUNTERS)."""
+    counts = np.empty((n, 2, N_COUNTERS), dtype=np.int32)
+    n_blocks = (n + SEED_BLOCK - 1) // SEED_BLOCK
+    for block in prange(n_blocks):
+        # Each thread seeds its own RNG state per fixed-size block, so results don't depend on
+        # how blocks are split across threads
+        np.random.seed((base_seed + block) % 4294967296)
+        for i in range(block * SEED_BLOCK, min(n, (block + 1) * SEED_BLOCK)):
+            counts[i] = _simulate_match(player1_stats, player2_stats, best_of)
+    return counts
+
+
+@njit(cache=True)
+def _seed_kernel_rng(seed):
+    np.random.seed(seed)
+
+
+########## VECTORIZED BATCH SIMULATION ##########
+# Pure NumPy equivalent of _simulate_many for installs without Numba: every unfinished
+# match advances by one point per step, so interpreter overhead is paid once per point
+# step rather than once per point of every match.
+
+def simulate_matches_batch(n_sims: int, player1_stats: np.ndarray, player2_stats: np.ndarray,
+                           best_of: int = 3, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Simulate n_sims independent matches at once with vectorized NumPy operations.
 
-        # Update Clean Set Bonus
-        if clean_set:
-            if set_winner == 'player1':
-                player1_fantasy_counts['CleanSet'] = True
-            else:
-                player2_fantasy_counts['CleanSet'] = True
+    Follows the same rules and point model as the compiled kernel (including tie-break rotation
+    and counter attribution), but plays service games point by point and draws from a PCG64
+    Generator instead of Numba's RNG.
 
-        sets.append({
-            'set_number': set_num,
-            'winner': set_winner,
-            'games': games,
-            'CleanSet': clean_set
-        })
+    Args:
+        n_sims (int): Number of matches to simulate.
+        player1_stats (np.ndarray): Rate stats for Player 1, either in RATE_COLS order
+            (see get_player_stats_array) or packed in SERVE_COLS order (see PlayerStats.to_array).
+        player2_stats (np.ndarray): Rate stats for Player 2, in either layout.
+        best_of (int, optional): Number of sets to play. Defaults to 3.
+        seed (Optional[int], optional): Seed for the Generator. Defaults to None.
 
-        sim_logger.debug(f"Set {set_num} Winner: {set_winner}, Score: Player1={player1_sets}-Player2={player2_sets}")
+    Returns:
+        np.ndarray: Int array of shape (n_sims, 2, N_COUNTERS) holding the COUNTERS for each player.
+    """
+    rng = np.random.default_rng(seed)
+    models = np.stack((_game_model(_serve_array(player1_stats)), _game_model(_serve_array(player2_stats))))
+    point_won = models[:, _POINT_WON]
+    required_sets = (best_of // 2) + 1
+
+    counts = np.zeros((n_sims, 2, N_COUNTERS), dtype=np.int32)
+    serve_won = np.zeros((n_sims, 2), dtype=np.int64)
+    serve_lost = np.zeros((n_sims, 2), dtype=np.int64)
+
+    # Per-row state of the matches still being played; ids maps each row to its match, and
+    # finished rows are dropped once they make up a quarter of the block
+    ids = np.arange(n_sims)
+    rows = np.arange(n_sims)
+    active = np.ones(n_sims, dtype=bool)
+    set_first_server = np.zeros(n_sims, dtype=np.int64)  # Player 1 serves first
+    game_server = np.zeros(n_sims, dtype=np.int64)
+    in_tie_break = np.zeros(n_sims, dtype=bool)
+    tie_break_played = np.zeros(n_sims, dtype=np.int64)
+    points = np.zeros((n_sims, 2), dtype=np.int64)
+    games = np.zeros((n_sims, 2), dtype=np.int64)
+
+    while ids.size:
+        # Tie-breaks: the set's first server serves one point, then players alternate every two
+        tie_break_server = set_first_server ^ _TIE_BREAK_CYCLE[tie_break_played & 3]
+        server = np.where(in_tie_break, tie_break_server, game_server)
+
+        # Play one point in every unfinished match; aces and double faults are sampled at the end
+        server_won = rng.random(ids.size) < point_won[server]
+        serve_won[ids, server] += active & server_won
+        serve_lost[ids, server] += active & ~server_won
+        points[rows, np.where(server_won, server, 1 - server)] += active
+        tie_break_played += active & in_tie_break
+
+        leader = (points[:, 1] > points[:, 0]).astype(np.int64)
+        margin = np.abs(points[:, 0] - points[:, 1])
+        top = points.max(axis=1)
+        game_over = active & ~in_tie_break & (top >= 4) & (margin >= 2)
+        tie_break_over = active & in_tie_break & (top >= 7) & (margin >= 2)
+
+        # Finished service games: credit the game and any break to the winner
+        games[rows, leader] += game_over
+        counts[ids, leader, _BREAKS] += game_over & (leader != game_server)
+        # Finished tie-breaks count as the deciding game of the set
+        games[rows, leader] += tie_break_over
+        points[game_over | tie_break_over] = 0
+
+        game_margin = np.abs(games[:, 0] - games[:, 1])
+        set_over = (game_over & (games.max(axis=1) >= 6) & (game_margin >= 2)) | tie_break_over
+        start_tie_break = game_over & (games[:, 0] == 6) & (games[:, 1] == 6)
+        in_tie_break = (in_tie_break & ~tie_break_over) | start_tie_break
+        tie_break_played[start_tie_break] = 0
+        game_server = np.where(game_over & ~set_over & ~start_tie_break, 1 - game_server, game_server)
+
+        if set_over.any():
+            done = np.flatnonzero(set_over)
+            done_ids = ids[done]
+            set_games = games[done]
+            winner = (set_games[:, 1] > set_games[:, 0]).astype(np.int64)
+            loser = 1 - winner
+            counts[done_ids, :, _GAMES_WON] += set_games.astype(np.int32)
+            counts[done_ids, :, _GAMES_LOST] += set_games[:, ::-1].astype(np.int32)
+            counts[done_ids, winner, _SETS_WON] += 1
+            counts[done_ids, loser, _SETS_LOST] += 1
+            clean = set_games[np.arange(len(done)), loser] == 0
+            counts[done_ids[clean], winner[clean], _CLEAN_SET] = 1
+            games[done] = 0
+            set_first_server[done] = 1 - set_first_server[done]
+            game_server[done] = set_first_server[done]
+
+            # Finished matches: record the winner and straight sets
+            match_over = counts[done_ids, winner, _SETS_WON] == required_sets
+            finished, match_winner = done_ids[match_over], winner[match_over]
+            counts[finished, match_winner, _MATCH_WON] = 1
+            straight = counts[finished, 1 - match_winner, _SETS_WON] == 0
+            counts[finished[straight], match_winner[straight], _STRAIGHT_SETS] = 1
+            active[done[match_over]] = False
+
+            # Compact the state so the long tail of matches doesn't pay for the finished ones
+            if 4 * np.count_nonzero(active) <= 3 * ids.size:
+                keep = np.flatnonzero(active)
+                ids = ids[keep]
+                rows = np.arange(keep.size)
+                active = active[keep]
+                set_first_server = set_first_server[keep]
+                game_server = game_server[keep]
+                in_tie_break = in_tie_break[keep]
+                tie_break_played = tie_break_played[keep]
+                points = points[keep]
+                games = games[keep]
+
+    # Given each player's serve points won and lost, aces and double faults are binomial
+    counts[:, :, _ACES] = rng.binomial(serve_won, models[:, _ACE_GIVEN_WON])
+    counts[:, :, _DOUBLE_FAULTS] = rng.binomial(serve_lost, models[:, _DF_GIVEN_LOST])
+    return counts
+
+
+def simulate_match_counts(player1_stats: np.ndarray, player2_stats: np.ndarray, best_of: int = 3,
+                          seed: Optional[int] = None) -> np.ndarray:
+    """
+    Simulate a single match with the compiled kernel.
 
-        # Check for match winner
-        required_sets = (best_of // 2) + 1
-        if player1_sets == required_sets or player2_sets == required_sets:
-            match_winner = 'player1' if player1_sets > player2_sets else 'player2'
-            match_duration = time.time() - match_start_time
+    Args:
+        player1_stats (np.ndarray): Rate stats for Player 1, either in RATE_COLS order
+            (see get_player_stats_array) or packed in SERVE_COLS order (see PlayerStats.to_array).
+        player2_stats (np.ndarray): Rate stats for Player 2, in either layout.
+        best_of (int, optional): Number of sets to play. Defaults to 3.
+        seed (Optional[int], optional): Seed for the kernel RNG, for reproducible runs. Defaults to None.
 
-            # Determine Straight Sets Bonus
-            straight_sets = (player1_sets == required_sets and player2_sets == 0) or \
-                            (player2_sets == required_sets and player1_sets == 0)
-            if straight_sets:
-                if match_winner == 'player1':
-                    player1_fantasy_counts['StraightSets'] = True
-                else:
-                    player2_fantasy_counts['StraightSets'] = True
-
-            # Prepare stats for fantasy points calculation for both players
-            fantasy_stats_player1 = {
-                'MatchPlayed': True,
-                'AdvancedByWalkover': False,
-                'Aces': player1_fantasy_counts['Aces'],
-                'DoubleFaults': player1_fantasy_counts['DoubleFaults'],
-                'GamesWon': player1_fantasy_counts['GamesWon'],
-                'GamesLost': player1_fantasy_counts['GamesLost'],
-                'SetsWon': player1_fantasy_counts['SetsWon'],
-                'SetsLost': player1_fantasy_counts['SetsLost'],
-                'CleanSet': player1_fantasy_counts['CleanSet'],
-                'StraightSets': player1_fantasy_counts['StraightSets'],
-                'NoDoubleFault': player1_fantasy_counts['NoDoubleFault'],
-                'TenPlusAces': player1_fantasy_counts['TenPlusAces'],
-                'FifteenPlusAces': player1_fantasy_counts['FifteenPlusAces'],
-                'Breaks': player1_fantasy_counts['Breaks'],
-                'BreakPointsConverted': player1_fantasy_counts['BreakPointsConverted']
-            }
+    Returns:
+        np.ndarray: Int array of shape (2, N_COUNTERS) holding the COUNTERS for each player.
+    """
+    if seed is not None:
+        _seed_kernel_rng(seed)
+    return _simulate_match(
+        _serve_array(player1_stats),
+        _serve_array(player2_stats),
+        best_of
+    )
 
-            fantasy_stats_player2 = {
-                'MatchPlayed': True,
-                'AdvancedByWalkover': False,
-                'Aces': player2_fantasy_counts['Aces'],
-                'DoubleFaults': player2_fantasy_counts['DoubleFaults'],
-                'GamesWon': player2_fantasy_counts['GamesWon'],
-                'GamesLost': player2_fantasy_counts['GamesLost'],
-                'SetsWon': player2_fantasy_counts['SetsWon'],
-                'SetsLost': player2_fantasy_counts['SetsLost'],
-                'CleanSet': player2_fantasy_counts['CleanSet'],
-                'StraightSets': player2_fantasy_counts['StraightSets'],
-                'NoDoubleFault': player2_fantasy_counts['NoDoubleFault'],
-                'TenPlusAces': player2_fantasy_counts['TenPlusAces'],
-                'FifteenPlusAces': player2_fantasy_counts['FifteenPlusAces'],
-                'Breaks': player2_fantasy_counts['Breaks'],
-                'BreakPointsConverted': player2_fantasy_counts['BreakPointsConverted']
-            }
 
-            # Calculate Fantasy Points
-            player1_fantasy_points = calculate_fantasy_points(
-                stats=fantasy_stats_player1,
-                match_won=(match_winner == 'player1'),
-                best_of=best_of
-            )
+def counts_to_fantasy_stats(counts: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Convert kernel counters into the fantasy stat arrays expected by calculate_fantasy_points_vec.
 
-            player2_fantasy_points = calculate_fantasy_points(
-                stats=fantasy_stats_player2,
-                match_won=(match_winner == 'player2'),
-                best_of=best_of
-            )
+    Args:
+        counts (np.ndarray): Array of shape (..., N_COUNTERS), e.g. (N,) matches for one player.
 
-            # Log Fantasy Points Breakdown
-            sim_logger.debug(f"{player1.Player} Fantasy Points: {player1_fantasy_points}")
-            sim_logger.debug(f"{player2.Player} Fantasy Points: {player2_fantasy_points}")
+    Returns:
+        Dict[str, np.ndarray]: Arrays keyed by FANTASY_STAT_FIELDS.
+    """
+    shape = counts.shape[:-1]
+    return _fantasy_stats(
+        lambda index: counts[..., index], np.ones(shape, dtype=bool), np.zeros(shape, dtype=bool)
+    )
 
-            # Return match results with separate fantasy points
-            return {
-                'winner': match_winner,
-                'sets': sets,
-                'player1_fantasy_points': player1_fantasy_points,
-                'player2_fantasy_points': player2_fantasy_points,
-                'duration': match_duration
-            }
 
-        set_num += 1
-        server_id = 2 if server_id == 1 else 1
+# Bonuses scored from thresholds on the match totals rather than from a counter column
+_DERIVED_BONUSES = ('MatchPlayed', 'NoDoubleFault', 'TenPlusAces', 'FifteenPlusAces')
+
+# (counter weights, derived bonus weights) for each best_of, filled on first use by score_counts
+_scoring_weights: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
 
 
-def run_match_simulation(player1_name: str, player2_name: str, surface: str, player_data: pd.DataFrame,
-                        best_of: int = 3) -> Optional[Dict[str, Any]]:
+def score_counts(counts: np.ndarray, best_of: int = 3) -> np.ndarray:
     """
-    Run a single match simulation between two players with comprehensive use of rate stats.
+    Vectorized fantasy points from a block of kernel counters.
+
+    The counter columns are scored with one matrix product against the per-counter DraftKings
+    weights; only the bonuses that depend on the totals are added afterwards.
 
     Args:
-        player1_name (str): Name of Player 1.
-        player2_name (str): Name of Player 2.
-        surface (str): Surface type ('Hard', 'Clay', 'Grass', 'All').
-        player_data (pd.DataFrame): DataFrame containing player statistics.
-        best_of (int, optional): Number of sets to play. Defaults to 3.
+        counts (np.ndarray): Array of shape (..., N_COUNTERS), e.g. (N,) matches for one player
+            or (N, 2) matches for both.
+        best_of (int, optional): Number of sets played. Defaults to 3.
 
     Returns:
-        Optional[Dict[str, Any]]: Dictionary containing match winner, detailed set results, and fantasy points.
+        np.ndarray: Float array of shape counts.shape[:-1] with the fantasy points for each match.
     """
-    try:
-        player1_stats_row = get_player_stats(player1_name, surface, player_data)
-        player2_stats_row = get_player_stats(player2_name, surface, player_data)
-
-        if player1_stats_row is None or player2_stats_row is None:
-            missing_player = player1_name if player1_stats_row is None else player2_name
-            sim_logger.error(SIM_LOG_MESSAGES["error_running_match_simulation"].format(
-                error=f"Player data not found for {missing_player}."
-            ))
-            return None
-    except ValueError as ve:
-        sim_logger.error(SIM_LOG_MESSAGES["error_running_match_simulation"].format(error=str(ve)))
-        return None
-
-    # Extract relevant statistics based on PlayerStats annotations
-    player1_stats_data = {k: v for k, v in player1_stats_row.to_dict().items() if k in PlayerStats.REQUIRED_FIELDS}
-    player2_stats_data = {k: v for k, v in player2_stats_row.to_dict().items() if k in PlayerStats.REQUIRED_FIELDS}
+    weights = _scoring_weights.get(best_of)
+    if weights is None:
+        weights = (fantasy_point_weights(COUNTERS, best_of), fantasy_point_weights(_DERIVED_BONUSES, best_of))
+        _scoring_weights[best_of] = weights
+    counter_weights, (match_played, no_double_fault, ten_plus_aces, fifteen_plus_aces) = weights
+
+    # Flatten to one (matches, counters) matrix so this is a single GEMV rather than a stack of tiny ones
+    points = (counts.reshape(-1, N_COUNTERS) @ counter_weights).reshape(counts.shape[:-1])
+    aces = counts[..., _ACES]
+    points += match_played
+    points += no_double_fault * (counts[..., _DOUBLE_FAULTS] == 0)
+    points += ten_plus_aces * (aces >= 10)
+    points += fifteen_plus_aces * (aces >= 15)
+    return points
+
+
+def simulate_many(n: int, player1_stats: np.ndarray, player2_stats: np.ndarray, best_of: int = 3,
+                  seed: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate n independent matches in parallel with the compiled kernel.
 
-    try:
-        player1_stats = PlayerStats(**player1_stats_data)
-        player2_stats = PlayerStats(**player2_stats_data)
-        sim_logger.info(SIM_LOG_MESSAGES["dataclass_initialized"])
-    except ValueError as ve:
-        sim_logger.error(SIM_LOG_MESSAGES["error_running_match_simulation"].format(error=str(ve)))
-        return None
+    Args:
+        n (int): Number of matches to simulate.
+        player1_stats (np.ndarray): Rate stats for Player 1, either in RATE_COLS order
+            (see get_player_stats_array) or packed in SERVE_COLS order (see PlayerStats.to_array).
+        player2_stats (np.ndarray): Rate stats for Player 2, in either layout.
+        best_of (int, optional): Number of sets to play. Defaults to 3.
+        seed (Optional[int], optional): Base seed; block b of SEED_BLOCK matches uses seed + b.
+            Defaults to a random seed.
 
-    try:
-        match_result = simulate_match(player1_stats, player2_stats, best_of)
-        return match_result
-    except Exception as e:
-        sim_logger.error(SIM_LOG_MESSAGES["error_running_match_simulation"].format(error=str(e)))
-        return None
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Fantasy points of shape (n,) for Player 1 and Player 2.
+    """
+    if seed is None:
+        seed = int(_rng.integers(4294967296))
+    if not NUMBA_AVAILABLE:
+        counts = simulate_matches_batch(n, player1_stats, player2_stats, best_of, seed)
+    else:
+        counts = _simulate_many(
+            n,
+            _serve_array(player1_stats),
+            _serve_array(player2_stats),
+            best_of,
+            seed % 4294967296
+        )
+    points = score_counts(counts, best_of)
+    return points[:, 0], points[:, 1]
@@ -8,26 +8,33 @@ players = ['Player 1', 'Player 2', 'Player 3']
 bins = np.linspace(0, 100, 20)
 placeholders = {player: st.empty() for player in players}
 
-# Initialize empty data storage for each player
-data = {player: [] for player in players}
+# Histogram counts per player, updated one data point at a time
+counts = {player: np.zeros(len(bins) - 1, dtype=np.int64) for player in players}
+
+# Build each player's figure once; the loop only changes bar heights
+figures = {}
+bars = {}
+for player in players:
+    fig, ax = plt.subplots()
+    _, _, bars[player] = ax.hist([], bins=bins, color='blue', alpha=0.7)
+    ax.set_xlim(0, 100)
+    ax.set_ylim(0, 20)
+    ax.set_xlabel('Fantasy Points')
+    ax.set_ylabel('Frequency')
+    ax.set_title(f"{player}'s Fantasy Points Distribution")
+    figures[player] = fig
 
 for i in range(100):  # Simulate 100 data points for each player
     for player in players:
-        # Append new data
+        # Add the new data point to its bin (ax.hist bins are closed on the right for the last one)
         new_data_point = np.random.normal(50, 10)
-        data[player].append(new_data_point)
-        
-        # Plot each player's histogram with current data
-        fig, ax = plt.subplots()
-        ax.hist(data[player], bins=bins, color='blue', alpha=0.7)
-        ax.set_xlim(0, 100)
-        ax.set_ylim(0, 20)
-        ax.set_xlabel('Fantasy Points')
-        ax.set_ylabel('Frequency')
-        ax.set_title(f"{player}'s Fantasy Points Distribution")
-        
+        if bins[0] <= new_data_point <= bins[-1]:
+            bin_index = min(np.searchsorted(bins, new_data_point, side='right') - 1, len(bins) - 2)
+            counts[player][bin_index] += 1
+            bars[player][bin_index].set_height(counts[player][bin_index])
+
         # Update the placeholder with the new plot
-        placeholders[player].pyplot(fig)
-    
+        placeholders[player].pyplot(figures[player])
+
     # Pause for effect
     time.sleep(0.1)
@@ -0,0 +1,111 @@
+# tests/test_optimizer.py
+
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules import optimizer
+
+
+def _slate(rng, n_players, salary_step=100):
+    """Random slate with salaries on a common step, as on DraftKings."""
+    return pd.DataFrame({
+        'Name': [f'Player {i}' for i in range(n_players)],
+        'salary': rng.integers(30, 110, n_players) * salary_step,
+        'AverageFantasyPoints': rng.uniform(5.0, 60.0, n_players).round(2),
+    })
+
+
+def _brute_force_points(lineup_data, salary_cap, roster_size):
+    """Best total projected points over every roster, or None if none fits under the cap."""
+    salaries = lineup_data['salary'].to_numpy()
+    points = lineup_data['AverageFantasyPoints'].to_numpy()
+    totals = [points[list(roster)].sum() for roster in combinations(range(len(lineup_data)), roster_size)
+              if salaries[list(roster)].sum() <= salary_cap]
+    return max(totals) if totals else None
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_dp_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    lineup_data = _slate(rng, int(rng.integers(6, 11)))
+    roster_size = int(rng.integers(2, 5))
+    salary_cap = int(rng.integers(roster_size * 40, roster_size * 90)) * 100
+
+    lineup = optimizer.optimize_lineup(lineup_data, salary_cap, roster_size)
+    expected = _brute_force_points(lineup_data, salary_cap, roster_size)
+
+    if expected is None:
+        assert lineup.empty
+    else:
+        assert len(lineup) == roster_size
+        assert lineup['Name'].is_unique
+        assert lineup['salary'].sum() <= salary_cap
+        assert lineup['AverageFantasyPoints'].sum() == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('salary_cap, roster_size', [(5000, 3), (50000, 7)])
+def test_infeasible_lineup_is_empty(salary_cap, roster_size):
+    lineup_data = _slate(np.random.default_rng(0), 6)  # Salaries are at least 3000 each
+    assert optimizer.optimize_lineup(lineup_data, salary_cap, roster_size).empty
+
+
+@pytest.fixture
+def lp_calls(monkeypatch):
+    calls = []
+    solve_lp = optimizer._optimize_lineup_lp
+
+    def record_lp(lineup_data, salary_cap, roster_size):
+        calls.append((salary_cap, roster_size))
+        return solve_lp(lineup_data, salary_cap, roster_size)
+
+    monkeypatch.setattr(optimizer, '_optimize_lineup_lp', record_lp)
+    return calls
+
+
+def test_integer_salaries_are_solved_by_dp(lp_calls):
+    lineup_data = _slate(np.random.default_rng(1), 8)
+    lineup = optimizer.optimize_lineup(lineup_data, 20000, 3)
+    assert lp_calls == []
+    assert lineup['AverageFantasyPoints'].sum() == pytest.approx(_brute_force_points(lineup_data, 20000, 3))
+
+
+def test_fractional_salaries_fall_back_to_milp(lp_calls):
+    lineup_data = _slate(np.random.default_rng(2), 8)
+    lineup_data['salary'] = lineup_data['salary'] + 0.5
+    lineup = optimizer.optimize_lineup(lineup_data, 20000, 3)
+    assert lp_calls == [(20000, 3)]
+    assert lineup['AverageFantasyPoints'].sum() == pytest.approx(_brute_force_points(lineup_data, 20000, 3))
+
+
+def test_oversize_dp_table_falls_back_to_milp(lp_calls, monkeypatch):
+    monkeypatch.setattr(optimizer, 'MAX_DP_CELLS', 10)
+    lineup_data = _slate(np.random.default_rng(3), 8)
+    lineup = optimizer.optimize_lineup(lineup_data, 20000, 3)
+    assert lp_calls == [(20000, 3)]
+    assert lineup['AverageFantasyPoints'].sum() == pytest.approx(_brute_force_points(lineup_data, 20000, 3))
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_milp_matches_dp(seed):
+    rng = np.random.default_rng(100 + seed)
+    lineup_data = _slate(rng, int(rng.integers(8, 16)))
+    roster_size = int(rng.integers(2, 7))
+    salary_cap = int(rng.integers(roster_size * 50, roster_size * 90)) * 100
+
+    points = lineup_data['AverageFantasyPoints'].to_numpy(dtype=np.float64)
+    salaries = lineup_data['salary'].to_numpy(dtype=np.int64) // 100
+    selected = optimizer._solve_lineup_dp(salaries, points, salary_cap // 100, roster_size)
+    lineup = optimizer._optimize_lineup_lp(lineup_data, salary_cap, roster_size)
+
+    assert selected is not None
+    assert len(lineup) == roster_size
+    assert lineup['salary'].sum() <= salary_cap
+    assert lineup['AverageFantasyPoints'].sum() == pytest.approx(points[selected].sum())
+
+
+def test_milp_infeasible_lineup_is_empty():
+    lineup_data = _slate(np.random.default_rng(4), 6)
+    assert optimizer._optimize_lineup_lp(lineup_data, 5000, 3).empty
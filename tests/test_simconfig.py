@@ -0,0 +1,82 @@
+# tests/test_simconfig.py
+
+import os
+import pandas as pd
+import pytest
+
+from modules.sim import simconfig
+from utils.logger import SIM_LOG_MESSAGES
+
+
+@pytest.fixture
+def stats_index():
+    player_data = pd.DataFrame({
+        'Player_lower': ['valid', 'invalid', 'invalid', 'fallback'],
+        'Surface_lower': ['clay', 'clay', 'all', 'all'],
+        'ValidStats': [True, False, True, True],
+    })
+    return simconfig.build_stats_index(player_data)
+
+
+@pytest.fixture
+def warnings(monkeypatch):
+    messages = []
+    monkeypatch.setattr(simconfig.sim_logger, 'warning', messages.append)
+    return messages
+
+
+def test_surface_row_is_used_without_warning(stats_index, warnings):
+    assert simconfig._find_row('Valid', 'Clay', stats_index) == 0
+    assert warnings == []
+
+
+def test_invalid_surface_row_does_not_fall_back(stats_index, warnings):
+    assert simconfig._find_row('Invalid', 'Clay', stats_index) is None
+    assert warnings == [SIM_LOG_MESSAGES["get_player_stats_invalid"].format(player_name='Invalid', surface='clay')]
+
+
+def test_all_surfaces_fallback_is_logged(stats_index, warnings):
+    assert simconfig._find_row('Fallback', 'Grass', stats_index) == 3
+    assert warnings == [SIM_LOG_MESSAGES["get_player_stats_fallback"].format(player_name='Fallback', surface='Grass')]
+
+
+def test_missing_player_is_logged(stats_index, warnings):
+    assert simconfig._find_row('Nobody', 'Hard', stats_index) is None
+    assert warnings == [SIM_LOG_MESSAGES["get_player_stats_warning"].format(player_name='Nobody', surface='Hard')]
+
+
+def test_stats_index_is_reused_for_the_same_frame(monkeypatch):
+    player_data = pd.DataFrame({'Player_lower': ['a'], 'Surface_lower': ['hard'], 'ValidStats': [True]})
+    builds = []
+    build_stats_index = simconfig.build_stats_index
+    monkeypatch.setattr(simconfig, 'build_stats_index', lambda frame: builds.append(frame) or build_stats_index(frame))
+
+    first = simconfig.get_stats_index(player_data)
+    assert simconfig.get_stats_index(player_data) is first
+    assert simconfig.get_stats_index(player_data.copy()) == first
+    assert len(builds) == 2
+
+
+def test_opponent_groups_leave_out_invalid_rows():
+    player_data = pd.DataFrame({
+        'Player': ['Valid', 'Invalid', 'Other'],
+        'Category': ['ATP', 'ATP', 'ATP'],
+        'Surface': ['Clay', 'Clay', 'Hard'],
+        'ValidStats': [True, False, False],
+    })
+    assert simconfig.build_opponent_groups(player_data) == {('ATP', 'Clay'): ('Valid',)}
+
+
+def test_parquet_copy_is_not_reused_for_a_replaced_csv(tmp_path):
+    pytest.importorskip('pyarrow')
+    csv_path = tmp_path / 'players.csv'
+    csv_path.write_text('Player,AcePercentage\nA,0.1\n')
+    os.utime(csv_path, ns=(2_000_000_000_000_000_000, 2_000_000_000_000_000_000))
+    assert simconfig._read_player_table(str(csv_path))['Player'].tolist() == ['A']
+    assert csv_path.with_suffix('.parquet').exists()
+
+    # Replace the CSV with a file carrying an older mtime, as cp -p or an unpacked archive would
+    csv_path.write_text('Player,AcePercentage\nB,0.2\n')
+    os.utime(csv_path, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_000))
+    assert simconfig._read_player_table(str(csv_path))['Player'].tolist() == ['B']
+    assert simconfig._read_player_table(str(csv_path))['Player'].tolist() == ['B']
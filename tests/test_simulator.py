@@ -0,0 +1,112 @@
+# tests/test_simulator.py
+
+import numpy as np
+import pytest
+
+from modules.sim import simulator
+from modules.sim.simconfig import PlayerStats, calculate_fantasy_points_vec
+
+
+def _player(name, first_serve, ace, first_serve_won, second_serve_won):
+    """PlayerStats with the given serve rates, no double faults and neutral values elsewhere."""
+    fields = {field_name: 0.5 for field_name in PlayerStats.REQUIRED_FIELDS}
+    fields.update(
+        Player=name, Surface='Hard', League='ATP',
+        FirstServePercentage=first_serve, AcePercentage=ace, FirstServeWonPercentage=first_serve_won,
+        SecondServeWonPercentage=second_serve_won, DoubleFaultPercentage=0.0
+    )
+    return PlayerStats(**fields)
+
+
+# Asymmetric players with certain outcomes: every point goes to the acer, so a tie-break ends 7-0
+# and the acer's ace count is the number of points they served
+ACER = _player('Acer', 1.0, 1.0, 1.0, 1.0)
+RECEIVER = _player('Receiver', 1.0, 0.0, 0.0, 0.0)
+
+
+@pytest.mark.parametrize('first_server, expected_aces', [(0, 3), (1, 4)])
+def test_tie_break_rotation_matches_kernel(first_server, expected_aces):
+    simulator.seed_reference_rng(0)
+    simulator._seed_kernel_rng(0)
+
+    reference = simulator.simulate_tie_break(first_server + 1, ACER, RECEIVER)
+
+    game_models = np.empty((2, simulator._GAME_MODEL_SIZE), dtype=np.float64)
+    game_models[0] = simulator._game_model(simulator._serve_array(ACER.to_array()))
+    game_models[1] = simulator._game_model(simulator._serve_array(RECEIVER.to_array()))
+    counts = np.zeros((2, simulator.N_COUNTERS), dtype=np.int32)
+    kernel_winner = simulator._play_tie_break(game_models, counts, first_server)
+
+    assert reference.winner == 'player1' and kernel_winner == 0
+    assert reference.player1_aces == counts[0, simulator._ACES] == expected_aces
+
+
+@pytest.mark.parametrize('server_id', [1, 2])
+def test_set_server_opens_tie_break(monkeypatch, server_id):
+    # Both players always hold, so the set reaches 6-6; the stub records who opens the tie-break
+    holder = _player('Holder', 1.0, 0.0, 1.0, 1.0)
+    opened_by = []
+
+    def record_tie_break(tie_break_server_id, player1, player2):
+        opened_by.append(tie_break_server_id)
+        return simulator.TieBreakResult('player1', 0, 0, 0, 0)
+
+    monkeypatch.setattr(simulator, 'simulate_tie_break', record_tie_break)
+    simulator.seed_reference_rng(0)
+    result = simulator.simulate_set(server_id, holder, holder)
+
+    # Twelve games alternate back to the set's first server, as in _play_set and simulate_matches_batch
+    assert (result.player1_games, result.player2_games) == (7, 6)
+    assert opened_by == [server_id]
+
+
+# Asymmetric but realistic players for the statistical checks
+BIG_SERVER = _player('Big Server', 0.62, 0.12, 0.78, 0.54)
+RETRIEVER = _player('Retriever', 0.66, 0.03, 0.66, 0.50)
+
+
+def test_reference_counts_match_kernel():
+    n_sims = 2000
+    simulator.seed_reference_rng(11)
+    reference = simulator.simulate_matches_reference(n_sims, BIG_SERVER, RETRIEVER)
+
+    simulator._seed_kernel_rng(11)
+    player1_stats, player2_stats = BIG_SERVER.to_array(), RETRIEVER.to_array()
+    kernel = np.stack([simulator.simulate_match_counts(player1_stats, player2_stats) for _ in range(n_sims)])
+
+    # Every counter's mean agrees within five standard errors of the difference
+    difference = reference.mean(axis=0) - kernel.mean(axis=0)
+    standard_error = np.sqrt((reference.var(axis=0) + kernel.var(axis=0)) / n_sims)
+    assert np.all(np.abs(difference) <= 5 * standard_error + 1e-9)
+
+
+def test_score_counts_matches_fantasy_stats_scoring():
+    simulator.seed_reference_rng(5)
+    counts = simulator.simulate_matches_reference(200, BIG_SERVER, RETRIEVER)
+
+    for player in range(2):
+        player_counts = counts[:, player]
+        match_won = player_counts[:, simulator._MATCH_WON].astype(bool)
+        expected = calculate_fantasy_points_vec(simulator.counts_to_fantasy_stats(player_counts), match_won, 3)
+        np.testing.assert_allclose(simulator.score_counts(player_counts, 3), expected)
+
+
+def test_simulate_matches_is_reproducible_across_workers():
+    parallel = simulator.simulate_matches(BIG_SERVER, RETRIEVER, 8, n_jobs=2, seed=3)
+    assert parallel.shape == (8, 2, simulator.N_COUNTERS)
+    np.testing.assert_array_equal(parallel, simulator.simulate_matches(BIG_SERVER, RETRIEVER, 8, n_jobs=2, seed=3))
+
+    # Worker 0 draws from seed + 0, so its chunk matches a single-process run with the same seed
+    np.testing.assert_array_equal(parallel[:4], simulator.simulate_matches(BIG_SERVER, RETRIEVER, 4, n_jobs=1, seed=3))
+
+
+def test_match_payload_matches_batch_fantasy_stats():
+    simulator.seed_reference_rng(9)
+    counts = np.zeros((2, simulator.N_COUNTERS), dtype=np.int32)
+    result = simulator.simulate_match(BIG_SERVER, RETRIEVER, 3, counts)
+
+    for player in range(2):
+        payload = result[f'player{player + 1}_stats']
+        batch = simulator.counts_to_fantasy_stats(counts[player])
+        assert payload['BreakPointsConverted'] == payload['Breaks']
+        assert {key: payload[key] for key in batch} == {key: value.item() for key, value in batch.items()}
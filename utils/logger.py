@@ -1,6 +1,9 @@
 # utils/logger.py
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 # Define SIM_LOG_MESSAGES with all required keys
 SIM_LOG_MESSAGES = {
@@ -10,6 +13,9 @@ SIM_LOG_MESSAGES = {
     "load_player_data": "Loaded player data from {filepath}.",
     "load_player_data_error": "Failed to load player data from {filepath}. Error: {error}",
     "get_player_stats_warning": "Player data not found for '{player_name}' on surface '{surface}'.",
+    "get_player_stats_fallback": "No stats for '{player_name}' on surface '{surface}'; using their 'All' surfaces stats.",
+    "get_player_stats_invalid": "Stats for '{player_name}' on surface '{surface}' are missing or outside [0, 1].",
+    "invalid_stats_rows": "Flagged {count} player rows with rate stats missing or outside [0, 1]; they will not be simulated.",
     "error_running_match_simulation": "Error running match simulation: {error}",
     "dataclass_initialized": "PlayerStats dataclass initialized successfully.",
     "variance_stat_value": "Original stat: {stats}, Variance: {variance}, Varied stat: {varied_stat}.",
@@ -48,8 +54,14 @@ def get_logger(name: str) -> logging.Logger:
         c_handler.setFormatter(c_format)
         f_handler.setFormatter(f_format)
 
-        # Add handlers to the logger
-        logger.addHandler(c_handler)
-        logger.addHandler(f_handler)
+        # Records are only queued on the caller's thread; a background listener performs the
+        # console and file writes, and is stopped at exit so queued records are flushed
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, c_handler, f_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+
+        # Add the queue handler to the logger
+        logger.addHandler(QueueHandler(log_queue))
 
     return logger